@@ -19,6 +19,12 @@ Basic Usage:
     >>> stops = umich.getStops()
     >>> vehicles = umich.getVehicles()
     >>> alerts = umich.getSystemAlerts()
+    >>>
+    >>> # Or fetch all of them concurrently
+    >>> snapshot = passiogo.getSystemSnapshot(umich)
+    >>>
+    >>> # Or keep vehicles up to date from a live feed
+    >>> wsapp = passiogo.launchWS(1270, print, background = True)
 
 Coordinate System:
     All geographic coordinates use the standard latitude/longitude format:
@@ -35,89 +41,31 @@ from .models import (
 	Route,
 	Stop,
 	SystemAlert,
-	Vehicle
+	Vehicle,
+	SystemSnapshot
 )
 
 # Import client functions
 from .client import (
 	getSystems,
 	getSystemFromID,
+	getSystemsFromIDs,
+	invalidateSystemsCache,
+	clearCache,
 	printAllSystemsMd,
+	getSystemSnapshot,
+	setSession,
 	BASE_URL
 )
 
-# For backward compatibility, also import websocket placeholder
-import json
-import websocket
-
-
-### Live Timings ###
-## Not Yet Supported! ##
-
-# Launch WebSocket
-def launchWS():
-	"""
-	Launch WebSocket connection for live vehicle tracking.
-
-	WARNING: This feature is not yet fully implemented.
-
-	The WebSocket functionality is planned for future releases to provide
-	real-time streaming updates of vehicle positions.
-	"""
-	uri = "wss://passio3.com/"
-
-
-	websocket.enableTrace(False) # For Debugging
-	wsapp = websocket.WebSocketApp(
-		uri,
-		on_open = subscribeWS,
-		#on_message = ...,
-		on_error = handleWsError,
-		on_close = handleWsClose
-	)
-	wsapp.run_forever(
-		ping_interval = 5,
-		ping_timeout = 3,
-	)
-
-
-def handleWsError(wsapp, error):
-	"""Handle WebSocket errors (not yet implemented)."""
-	...
-
-
-def handleWsClose(wsapp, close_status_code, close_msg):
-	"""Handle WebSocket close events (not yet implemented)."""
-	wsapp.close()
-
-
-def subscribeWS(
-	wsapp,
-	userId
-):
-	"""
-	Subscribe to vehicle location updates via WebSocket.
-
-	WARNING: This feature is not yet fully implemented.
-
-	Args:
-		wsapp: WebSocket app instance
-		userId: Transportation system ID to subscribe to
-	"""
-
-	subscriptionMsg = {
-		"subscribe":"location",
-		"userId":[userId],
-		"field":[
-			"busId",
-			"latitude",
-			"longitude",
-			"course",
-			"paxLoad",
-			"more"
-		]
-	}
-	wsapp.send(json.dumps(subscriptionMsg))
+# Import live feed functions
+from .live import (
+	launchWS,
+	getLatencyMs,
+	subscribeWS,
+	handleWsError,
+	handleWsClose
+)
 
 
 # Package metadata
@@ -129,12 +77,19 @@ __all__ = [
 	"Stop",
 	"SystemAlert",
 	"Vehicle",
+	"SystemSnapshot",
 	# Functions
 	"getSystems",
 	"getSystemFromID",
+	"getSystemsFromIDs",
+	"invalidateSystemsCache",
+	"clearCache",
 	"printAllSystemsMd",
-	# WebSocket (not yet supported)
+	"getSystemSnapshot",
+	"setSession",
+	# Live feed
 	"launchWS",
+	"getLatencyMs",
 	"subscribeWS",
 	# Constants
 	"BASE_URL",
@@ -0,0 +1,123 @@
+"""
+PassioGo Spatial Kernels
+
+Array kernels used by passiogo.spatial. They are compiled with Numba when it
+is installed (`pip install passiogo[numba]`), and fall back to equivalent
+vectorized NumPy code otherwise.
+
+Author: PassioGo Contributors
+License: See LICENSE file
+"""
+
+import math
+import numpy as np
+
+try:
+	from numba import njit, prange
+except ImportError:
+	njit = None
+
+# Mean Earth radius, in meters
+EARTH_RADIUS_M = 6371008.8
+
+
+def _haversineThreshold(radius: float) -> float:
+	"""
+	Convert a distance to the haversine value it corresponds to.
+
+	Comparing haversine values directly avoids computing a square root and
+	an arcsine for every point.
+
+	Args:
+		radius: Distance in meters
+
+	Returns:
+		float: sin²(radius / 2R), with R the Earth radius
+	"""
+	halfAngle = min(radius / (2 * EARTH_RADIUS_M), math.pi / 2)
+	return(math.sin(halfAngle) ** 2)
+
+
+def _haversineWithinNumpy(
+	latitudes: np.ndarray,
+	longitudes: np.ndarray,
+	latitude: float,
+	longitude: float,
+	threshold: float
+) -> np.ndarray:
+	"""
+	NumPy version of the haversine kernel.
+
+	Args:
+		latitudes: Latitudes of the points, in degrees
+		longitudes: Longitudes of the points, in degrees
+		latitude: Latitude of the center, in degrees
+		longitude: Longitude of the center, in degrees
+		threshold: Value returned by _haversineThreshold()
+
+	Returns:
+		numpy.ndarray: Whether each point is within the distance
+	"""
+	latitudesRad = np.radians(latitudes)
+	latitudeRad = math.radians(latitude)
+	sinHalfDLat = np.sin((latitudesRad - latitudeRad) / 2)
+	sinHalfDLon = np.sin(np.radians(longitudes - longitude) / 2)
+	haversine = sinHalfDLat * sinHalfDLat + np.cos(latitudesRad) * math.cos(latitudeRad) * sinHalfDLon * sinHalfDLon
+	return(haversine <= threshold)
+
+
+if njit is not None:
+	# fastmath is left off: missing coordinates are NaN and must compare False
+	@njit(cache = True, parallel = True)
+	def _haversineWithinNumba(latitudes, longitudes, latitude, longitude, threshold):
+		"""Numba version of the haversine kernel, see _haversineWithinNumpy()."""
+		within = np.empty(latitudes.size, np.bool_)
+		latitudeRad = math.radians(latitude)
+		cosLatitude = math.cos(latitudeRad)
+		for i in prange(latitudes.size):
+			pointLatitudeRad = math.radians(latitudes[i])
+			sinHalfDLat = math.sin((pointLatitudeRad - latitudeRad) / 2)
+			sinHalfDLon = math.sin(math.radians(longitudes[i] - longitude) / 2)
+			haversine = sinHalfDLat * sinHalfDLat + math.cos(pointLatitudeRad) * cosLatitude * sinHalfDLon * sinHalfDLon
+			within[i] = haversine <= threshold
+		return(within)
+else:
+	_haversineWithinNumba = None
+
+
+def haversineWithin(
+	latitudes: np.ndarray,
+	longitudes: np.ndarray,
+	latitude: float,
+	longitude: float,
+	radius: float
+) -> np.ndarray:
+	"""
+	Find the points within a great-circle distance of a center.
+
+	Args:
+		latitudes: Latitudes of the points, in degrees
+		longitudes: Longitudes of the points, in degrees
+		latitude: Latitude of the center, in degrees
+		longitude: Longitude of the center, in degrees
+		radius: Distance in meters
+
+	Returns:
+		numpy.ndarray: Boolean mask, True for each point within `radius`
+		               meters of the center. Points with NaN coordinates
+		               are never within.
+	"""
+	threshold = _haversineThreshold(radius)
+	latitudes = np.ascontiguousarray(latitudes, dtype = np.float64)
+	longitudes = np.ascontiguousarray(longitudes, dtype = np.float64)
+
+	if _haversineWithinNumba is not None:
+		return(_haversineWithinNumba(
+			latitudes,
+			longitudes,
+			float(latitude),
+			float(longitude),
+			threshold
+		))
+
+	return(_haversineWithinNumpy(latitudes, longitudes, latitude, longitude, threshold))
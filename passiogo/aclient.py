@@ -0,0 +1,398 @@
+"""
+PassioGo Async API Client
+
+Asynchronous counterpart of passiogo.client built on aiohttp. Useful to fetch
+data for many transportation systems at once: all requests share a single
+event loop and connection pool, so the total wait is close to the slowest
+request rather than the sum of all of them.
+
+Requires the optional `async` extra:
+
+    pip install passiogo[async]
+
+Responses are parsed by the same functions as the synchronous client, so the
+returned objects are identical.
+
+Example:
+    >>> import asyncio
+    >>> import passiogo
+    >>> from passiogo import aclient
+    >>>
+    >>> async def main():
+    ...     systems = await aclient.getSystems()
+    ...     snapshots = await aclient.getAllSystemsData(systems[:20])
+    ...     await aclient.closeSession()
+    ...     return snapshots
+    >>>
+    >>> snapshots = asyncio.run(main())
+
+Author: PassioGo Contributors
+License: See LICENSE file
+"""
+
+import copy
+import asyncio
+import aiohttp
+from typing import Optional, List
+from .models import TransportationSystem, Route, Stop, SystemAlert, Vehicle, SystemSnapshot
+from .client import (
+	BASE_URL,
+	REQUEST_TIMEOUT,
+	_responseCacheKey,
+	_validatorHeaders,
+	_processResponse,
+	_NOT_CACHED,
+	_getSystemsFromCache,
+	_storeSystems,
+	_parseRoutes,
+	_parseStops,
+	_parseSystemAlerts,
+	_parseVehicles,
+)
+
+# aiohttp sessions are bound to the event loop they were created in
+_SESSION = None
+_SESSION_LOOP = None
+
+
+async def _getSession() -> aiohttp.ClientSession:
+	"""
+	Get the HTTP session shared by all async API requests.
+
+	A new session is created on first use, or if the previous one was closed
+	or belongs to another event loop.
+
+	Returns:
+		aiohttp.ClientSession: Session with a pooled connector
+	"""
+	global _SESSION, _SESSION_LOOP
+
+	loop = asyncio.get_running_loop()
+	if(
+		_SESSION is None or
+		_SESSION.closed or
+		_SESSION_LOOP is not loop
+	):
+		_SESSION = aiohttp.ClientSession(
+			connector = aiohttp.TCPConnector(limit = 50),
+			headers = {"User-Agent": "PassioGo Python Client"},
+			timeout = aiohttp.ClientTimeout(total = REQUEST_TIMEOUT),
+		)
+		_SESSION_LOOP = loop
+	return(_SESSION)
+
+
+def setSession(session: aiohttp.ClientSession):
+	"""
+	Replace the HTTP session used for all async API requests.
+
+	Must be called from the running event loop the session will be used in.
+
+	Args:
+		session: A configured aiohttp.ClientSession instance
+	"""
+	global _SESSION, _SESSION_LOOP
+	_SESSION = session
+	_SESSION_LOOP = asyncio.get_running_loop()
+
+
+async def closeSession():
+	"""
+	Close the HTTP session used for all async API requests.
+
+	Should be awaited before the event loop is closed.
+	"""
+	global _SESSION, _SESSION_LOOP
+	if _SESSION is not None:
+		await _SESSION.close()
+	_SESSION = None
+	_SESSION_LOOP = None
+
+
+async def sendApiRequest(url: str, body: Optional[dict]) -> Optional[dict]:
+	"""
+	Send a POST request to the Passio Go API.
+
+	Async version of passiogo.client.sendApiRequest(), sharing its response cache.
+
+	Args:
+		url: Full API endpoint URL
+		body: JSON body to send (can be None for some endpoints)
+
+	Returns:
+		dict: JSON response from the API
+		None: If request failed
+
+	Raises:
+		Exception: If response cannot be parsed as JSON
+		Exception: If API returns an error response
+	"""
+
+	# Send Request
+	cacheKey = _responseCacheKey(url, body)
+	validators = _validatorHeaders(cacheKey)
+	session = await _getSession()
+	async with session.post(
+		url,
+		json = body,
+		headers = validators
+	) as response:
+		content = await response.read()
+	result = _processResponse(
+		cacheKey,
+		response.status,
+		response.headers,
+		content,
+		conditional = bool(validators)
+	)
+
+	# Resend Without Validators
+	# (the cached response was evicted before the 304 Not Modified arrived)
+	if result is _NOT_CACHED:
+		async with session.post(
+			url,
+			json = body
+		) as response:
+			content = await response.read()
+		result = _processResponse(
+			cacheKey,
+			response.status,
+			response.headers,
+			content
+		)
+
+	return(result)
+
+
+async def getSystems(
+	appVersion: int = 2,
+	sortMode: int = 1,
+) -> List[TransportationSystem]:
+	"""
+	Get all available transportation systems.
+
+	Async version of passiogo.getSystems(), sharing its cache.
+
+	Args:
+		appVersion: API version to use (default: 2)
+		sortMode: Sorting mode for results (default: 1)
+
+	Returns:
+		List of TransportationSystem objects
+	"""
+
+	# Return Cached Systems
+	cachedSystems = _getSystemsFromCache(appVersion, sortMode)
+	if(cachedSystems is not None):
+		return(cachedSystems)
+
+
+	# Initialize & Send Request
+	url = f"{BASE_URL}/mapGetData.php?getSystems={appVersion}&sortMode={sortMode}&credentials=1"
+	systems = await sendApiRequest(url, None)
+
+
+	# Handle Request Error
+	if(systems == None):
+		return([])
+
+	return(_storeSystems(systems, appVersion, sortMode))
+
+
+async def getRoutes(
+	system: TransportationSystem,
+	appVersion: int = 1,
+	amount: int = 1
+) -> List[Route]:
+	"""
+	Get all routes for a transportation system.
+
+	Async version of TransportationSystem.getRoutes().
+
+	Args:
+		system: The TransportationSystem to query
+		appVersion: API version parameter (default: 1)
+		amount: Controls which routes are returned (default: 1)
+
+	Returns:
+		List of Route objects
+	"""
+
+	# Initialize & Send Request
+	url = BASE_URL+f"/mapGetData.php?getRoutes={appVersion}"
+	body = {
+			"systemSelected0" : str(system.id),
+			"amount" : amount
+			}
+	routes = await sendApiRequest(url, body)
+
+	# Handle Request Error
+	if(routes == None):
+		return(None)
+
+	return(_parseRoutes(routes, system))
+
+
+async def getStops(
+	system: TransportationSystem,
+	appVersion: int = 2,
+	sA: int = 1,
+	raw: bool = False
+) -> List[Stop]:
+	"""
+	Get all stops for a transportation system.
+
+	Async version of TransportationSystem.getStops().
+
+	Args:
+		system: The TransportationSystem to query
+		appVersion: API version parameter (default: 2)
+		sA: Controls which stops are returned (default: 1)
+		raw: If True, returns raw API response dict instead of Stop objects
+
+	Returns:
+		List of Stop objects, or dict if raw=True
+	"""
+
+	# Initialize & Send Request
+	url = BASE_URL+"/mapGetData.php?getStops="+str(appVersion)
+	body = {
+		"s0" : str(system.id),
+		"sA" : sA
+	}
+	stops = await sendApiRequest(url, body)
+
+	# Return Raw Response
+	# (copied, the parsed response is shared with the response cache)
+	if raw:
+		return(copy.deepcopy(stops))
+
+	# Handle Request Error
+	if(stops == None):
+		return(None)
+
+	return(_parseStops(stops, system))
+
+
+async def getSystemAlerts(
+	system: TransportationSystem,
+	appVersion: int = 1,
+	amount: int = 1,
+	routesAmount: int = 0
+) -> List[SystemAlert]:
+	"""
+	Get all active alerts for a transportation system.
+
+	Async version of TransportationSystem.getSystemAlerts().
+
+	Args:
+		system: The TransportationSystem to query
+		appVersion: API version parameter (default: 1)
+		amount: Number of alerts to retrieve (default: 1)
+		routesAmount: Route filtering parameter (default: 0)
+
+	Returns:
+		List of SystemAlert objects
+	"""
+
+	# Initialize & Send Request
+	url = BASE_URL+f"/goServices.php?getAlertMessages={appVersion}"
+	body = {
+		"systemSelected0" : str(system.id),
+		"amount" : amount,
+		"routesAmount":routesAmount
+	}
+	errorMsgs = await sendApiRequest(url, body)
+
+	# Handle Request Error
+	if(errorMsgs == None):
+		return(None)
+
+	return(_parseSystemAlerts(errorMsgs, system))
+
+
+async def getVehicles(
+	system: TransportationSystem,
+	appVersion: int = 2
+) -> List[Vehicle]:
+	"""
+	Get all currently active vehicles for a transportation system.
+
+	Async version of TransportationSystem.getVehicles().
+
+	Args:
+		system: The TransportationSystem to query
+		appVersion: API version parameter (default: 2)
+
+	Returns:
+		List of Vehicle objects with real-time positions
+	"""
+
+	# Initialize & Send Request
+	url = BASE_URL+"/mapGetData.php?getBuses="+str(appVersion)
+	body = {
+		"s0" : str(system.id),
+		"sA" : 1
+	}
+	vehicles = await sendApiRequest(url, body)
+
+	# Handle Request Error
+	if(vehicles == None):
+		return(None)
+
+	return(_parseVehicles(vehicles, system))
+
+
+async def getSystemSnapshot(
+	system: TransportationSystem
+) -> SystemSnapshot:
+	"""
+	Get the routes, stops, alerts and vehicles of a transportation system at once.
+
+	Async version of passiogo.getSystemSnapshot().
+
+	Args:
+		system: The TransportationSystem to query
+
+	Returns:
+		SystemSnapshot with the routes, stops, alerts and vehicles of the system
+	"""
+	routes, stops, alerts, vehicles = await asyncio.gather(
+		getRoutes(system),
+		getStops(system),
+		getSystemAlerts(system),
+		getVehicles(system),
+	)
+
+	return(SystemSnapshot(
+		system = system,
+		routes = routes,
+		stops = stops,
+		alerts = alerts,
+		vehicles = vehicles,
+	))
+
+
+async def getAllSystemsData(
+	systems: List[TransportationSystem]
+) -> List[SystemSnapshot]:
+	"""
+	Get the routes, stops, alerts and vehicles of many transportation systems at once.
+
+	All requests are sent concurrently over the shared connection pool.
+
+	Args:
+		systems: List of TransportationSystem objects to query
+
+	Returns:
+		List of SystemSnapshot objects, in the same order as `systems`
+
+	Example:
+		>>> systems = await aclient.getSystems()
+		>>> snapshots = await aclient.getAllSystemsData(systems)
+		>>> for snapshot in snapshots:
+		...     print(f"{snapshot.system.name}: {len(snapshot.vehicles)} vehicles")
+	"""
+	return(list(await asyncio.gather(
+		*(getSystemSnapshot(system) for system in systems)
+	)))
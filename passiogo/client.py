@@ -8,11 +8,159 @@ Author: PassioGo Contributors
 License: See LICENSE file
 """
 
+import os
+import copy
+import json
+import time
+import hashlib
+import operator
+import tempfile
+import functools
+import itertools
+import threading
 import requests
-from typing import Optional, List
-from .models import TransportationSystem, Route, Stop, SystemAlert, Vehicle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, List
+from .models import TransportationSystem, Route, Stop, SystemAlert, Vehicle, SystemSnapshot, _intern, _VALIDATE
+
+# Use orjson to decode responses when it is installed (pip install passiogo[fast])
+try:
+	import orjson
+	_loadJson = orjson.loads
+except ImportError:
+	_loadJson = json.loads
+
+# Use ijson to stream large stop lists when requested (pip install passiogo[stream])
+try:
+	import ijson
+except ImportError:
+	ijson = None
+
+# Use platformdirs to locate the cache directory when it is installed
+try:
+	import platformdirs
+	_CACHE_DIR = platformdirs.user_cache_dir("passiogo")
+except ImportError:
+	_CACHE_DIR = os.path.join(
+		os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+		"passiogo"
+	)
 
 BASE_URL = "https://passiogo.com"
+REQUEST_TIMEOUT = 30
+
+# System Data Cache
+# Number of seconds the results of each TransportationSystem method are kept
+_ROUTES_TTL = 600
+_STOPS_TTL = 600
+_SYSTEM_ALERTS_TTL = 60
+_VEHICLES_TTL = 2
+
+# Retries
+# Transient server errors are retried with an exponential backoff
+# (0.3s, 0.6s, 1.2s) before the response is handed to the parser
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.3
+_RETRY_STATUS_FORCELIST = (500, 502, 503, 504)
+
+# Response Cache
+# {(url, body) -> {"etag", "lastModified", "hash", "response"}}
+# Lets unchanged responses be reused without being downloaded or parsed again.
+# Only the _ETAG_CACHE_SIZE most recently used responses are kept.
+_ETAG_CACHE_SIZE = 128
+_etagCache = OrderedDict()
+_etagCacheLock = threading.Lock()
+
+# Returned by _processResponse() for a 304 Not Modified whose cached response
+# was evicted after the request was sent, the request must be sent again
+# without validators
+_NOT_CACHED = object()
+
+# Live Vehicles
+# {systemId -> {vehicleId -> Vehicle}}, kept up to date by passiogo.live while
+# a WebSocket feed is connected for the system
+_liveVehicles = {}
+
+# Systems Cache
+# The list of systems rarely changes, so it is kept for `_SYSTEMS_TTL` seconds,
+# in memory and in `_SYSTEMS_CACHE_FILE` to be shared between processes
+_SYSTEMS_TTL = 3600
+_SYSTEMS_CACHE_FILE = os.path.join(_CACHE_DIR, "systems.json")
+_systemsCache = {
+	"ts": 0,
+	"fetchedAt": None,
+	"appVersion": None,
+	"sortMode": None,
+	"data": None,
+	"byId": {},
+}
+
+def _createRetry() -> Retry:
+	"""
+	Create the retry strategy of the shared HTTP session.
+
+	All API requests are POST requests, which urllib3 does not retry by
+	default, so they are allowed explicitly.
+
+	Returns:
+		Retry: Retry strategy for transient server errors
+	"""
+	retryKwargs = {
+		"total" : _RETRY_TOTAL,
+		"backoff_factor" : _RETRY_BACKOFF_FACTOR,
+		"status_forcelist" : _RETRY_STATUS_FORCELIST,
+		"raise_on_status" : False,
+	}
+	try:
+		return(Retry(allowed_methods = frozenset(["POST"]), **retryKwargs))
+	except TypeError:
+		# urllib3 < 1.26
+		return(Retry(method_whitelist = frozenset(["POST"]), **retryKwargs))
+
+
+def _createSession() -> requests.Session:
+	"""
+	Create the HTTP session shared by all API requests.
+
+	Reusing one session keeps connections to the Passio Go servers alive
+	between calls instead of opening a new TCP/TLS connection every time.
+
+	Returns:
+		requests.Session: Session with a pooled, retrying HTTPS adapter mounted
+	"""
+	session = requests.Session()
+	session.mount("https://", HTTPAdapter(
+		pool_connections = 4,
+		pool_maxsize = 20,
+		max_retries = _createRetry()
+	))
+	session.headers.update({"User-Agent": "PassioGo Python Client"})
+	return(session)
+
+
+_SESSION = _createSession()
+
+
+def setSession(session: requests.Session):
+	"""
+	Replace the HTTP session used for all API requests.
+
+	Useful to configure proxies, headers, retries or authentication once for
+	the whole library.
+
+	Args:
+		session: A configured requests.Session instance
+
+	Example:
+		>>> session = requests.Session()
+		>>> session.proxies = {"https": "http://proxy.example.com:8080"}
+		>>> passiogo.setSession(session)
+	"""
+	global _SESSION
+	_SESSION = session
 
 
 def toIntInclNone(toInt):
@@ -25,41 +173,140 @@ def toIntInclNone(toInt):
 	Returns:
 		int or None: Integer value or None if input was None
 	"""
-	if toInt == None:
-		return toInt
-	return(int(toInt))
+	return(None if toInt is None else int(toInt))
 
 
-def sendApiRequest(url: str, body: Optional[dict]) -> Optional[dict]:
+def _nonEmpty(value):
 	"""
-	Send a POST request to the Passio Go API.
+	Read an empty string returned by the API as None.
+
+	Args:
+		value: Value of a record field
+
+	Returns:
+		The value, or None if it was an empty string
+	"""
+	return(None if value == '' else value)
+
+
+def _checkInt(value, message: str) -> int:
+	"""
+	Check that an argument is an integer, such as an int or a NumPy integer.
+
+	Args:
+		value: Argument to check
+		message: Message of the TypeError raised if it is not an integer
+
+	Returns:
+		int: Value of the argument
+
+	Raises:
+		TypeError: If the argument is not an integer, or is a bool
+	"""
+	if isinstance(value, bool):
+		raise TypeError(message)
+	try:
+		return(operator.index(value))
+	except TypeError:
+		raise TypeError(message) from None
+
+
+def _intToBoolInclNone(value):
+	"""
+	Convert a "0" / "1" flag returned by the API to a bool, preserving None.
+
+	Args:
+		value: Flag to convert (can be int, str, or None)
+
+	Returns:
+		bool or None: Value of the flag or None if input was None
+	"""
+	return(None if value is None else bool(int(value)))
+
+
+def _responseCacheKey(url: str, body: Optional[dict]) -> tuple:
+	"""
+	Build the key identifying a request in the response cache.
 
 	Args:
 		url: Full API endpoint URL
-		body: JSON body to send (can be None for some endpoints)
+		body: JSON body sent with the request
+
+	Returns:
+		tuple: Hashable (url, body) key
+	"""
+	return((url, None if body is None else frozenset(body.items())))
+
+
+def _validatorHeaders(cacheKey: tuple) -> dict:
+	"""
+	Build the conditional request headers for a previously cached response.
+
+	Args:
+		cacheKey: Key returned by _responseCacheKey()
+
+	Returns:
+		dict: If-None-Match / If-Modified-Since headers (empty if nothing is cached)
+	"""
+	cached = _etagCache.get(cacheKey)
+	headers = {}
+	if cached is not None:
+		if cached["etag"] is not None:
+			headers["If-None-Match"] = cached["etag"]
+		if cached["lastModified"] is not None:
+			headers["If-Modified-Since"] = cached["lastModified"]
+	return(headers)
+
+
+def _processResponse(
+	cacheKey: tuple,
+	statusCode: int,
+	headers,
+	content: bytes,
+	conditional: bool = False
+) -> Optional[dict]:
+	"""
+	Parse an API response, reusing the cached one when it has not changed.
+
+	Args:
+		cacheKey: Key returned by _responseCacheKey()
+		statusCode: HTTP status code of the response
+		headers: HTTP headers of the response
+		content: Raw body of the response
+		conditional: Whether the request was sent with validators
 
 	Returns:
 		dict: JSON response from the API
 		None: If request failed
+		_NOT_CACHED: If the response is a 304 Not Modified to a conditional
+			request but the cached response has been evicted since
 
 	Raises:
 		Exception: If response cannot be parsed as JSON
 		Exception: If API returns an error response
-
-	Example:
-		>>> url = "https://passiogo.com/mapGetData.php?getSystems=2&sortMode=1&credentials=1"
-		>>> response = sendApiRequest(url, None)
 	"""
-
-	# Send Request
-	response = requests.post(url, json = body)
+	with _etagCacheLock:
+		cached = _etagCache.get(cacheKey)
+		if cached is not None:
+			_etagCache.move_to_end(cacheKey)
+
+	# Handle Not Modified Response
+	if statusCode == 304:
+		if cached is not None:
+			return(cached["response"])
+		if conditional:
+			return(_NOT_CACHED)
+
+	# Handle Unchanged Response
+	contentHash = hashlib.sha1(content).digest()
+	if cached is not None and cached["hash"] == contentHash:
+		return(cached["response"])
 
 	try:
 		# Handle JSON Response
-		response = response.json()
+		response = _loadJson(content)
 	except Exception as e:
-		raise Exception(f"Error converting API response to JSON! Here is the response received: {response}")
-		return None
+		raise Exception(f"Error converting API response to JSON! Here is the response received: {content}") from e
 
 
 	# Handle API Error
@@ -69,9 +316,115 @@ def sendApiRequest(url: str, body: Optional[dict]) -> Optional[dict]:
 	):
 		raise Exception(f"Error in Response! Here is the received response: {response}")
 
+	# Cache Response
+	with _etagCacheLock:
+		_etagCache[cacheKey] = {
+			"etag": headers.get("ETag"),
+			"lastModified": headers.get("Last-Modified"),
+			"hash": contentHash,
+			"response": response,
+		}
+		_etagCache.move_to_end(cacheKey)
+		if len(_etagCache) > _ETAG_CACHE_SIZE:
+			_etagCache.popitem(last = False)
+
 	return(response)
 
 
+def sendApiRequest(url: str, body: Optional[dict]) -> Optional[dict]:
+	"""
+	Send a POST request to the Passio Go API.
+
+	The ETag / Last-Modified validators of each response are replayed on the
+	next identical request. If the server answers 304 Not Modified, or sends
+	back a body identical to the previous one, the previously parsed response
+	is returned as is: it is shared with later calls and must not be modified.
+
+	Args:
+		url: Full API endpoint URL
+		body: JSON body to send (can be None for some endpoints)
+
+	Returns:
+		dict: JSON response from the API
+		None: If request failed
+
+	Raises:
+		Exception: If response cannot be parsed as JSON
+		Exception: If API returns an error response
+
+	Example:
+		>>> url = "https://passiogo.com/mapGetData.php?getSystems=2&sortMode=1&credentials=1"
+		>>> response = sendApiRequest(url, None)
+	"""
+
+	# Send Request
+	cacheKey = _responseCacheKey(url, body)
+	validators = _validatorHeaders(cacheKey)
+	response = _SESSION.post(
+		url,
+		json = body,
+		headers = validators,
+		timeout = REQUEST_TIMEOUT
+	)
+	result = _processResponse(
+		cacheKey,
+		response.status_code,
+		response.headers,
+		response.content,
+		conditional = bool(validators)
+	)
+
+	# Resend Without Validators
+	# (the cached response was evicted before the 304 Not Modified arrived)
+	if result is _NOT_CACHED:
+		response = _SESSION.post(
+			url,
+			json = body,
+			timeout = REQUEST_TIMEOUT
+		)
+		result = _processResponse(
+			cacheKey,
+			response.status_code,
+			response.headers,
+			response.content
+		)
+
+	return(result)
+
+
+def invalidateSystemsCache():
+	"""
+	Clear the cached list of transportation systems, in memory and on disk.
+
+	The next call to getSystems() or getSystemFromID() will fetch the list
+	of systems from the API again.
+	"""
+	_systemsCache.update({
+		"ts": 0,
+		"fetchedAt": None,
+		"appVersion": None,
+		"sortMode": None,
+		"data": None,
+		"byId": {},
+	})
+
+	try:
+		os.remove(_SYSTEMS_CACHE_FILE)
+	except OSError:
+		pass
+
+
+def clearCache():
+	"""
+	Clear every cache kept by the library.
+
+	This includes the list of systems (in memory and on disk) and the
+	cached API responses.
+	"""
+	invalidateSystemsCache()
+	_etagCache.clear()
+
+
 def getSystems(
 	appVersion: int = 2,
 	sortMode: int = 1,
@@ -82,6 +435,9 @@ def getSystems(
 	Retrieves the complete list of transit agencies available through Passio Go,
 	including universities, municipalities, airports, and paratransit services.
 
+	Results are cached for one hour, in memory and on disk so that they are
+	shared between processes. Use invalidateSystemsCache() to force a refresh.
+
 	Args:
 		appVersion: API version to use (default: 2)
 		            - Values < 2: Returns error
@@ -102,6 +458,12 @@ def getSystems(
 	"""
 
 
+	# Return Cached Systems
+	cachedSystems = _getSystemsFromCache(appVersion, sortMode)
+	if(cachedSystems is not None):
+		return(cachedSystems)
+
+
 	# Initialize & Send Request
 	url = f"{BASE_URL}/mapGetData.php?getSystems={appVersion}&sortMode={sortMode}&credentials=1"
 	systems = sendApiRequest(url, None)
@@ -111,39 +473,236 @@ def getSystems(
 	if(systems == None):
 		return([])
 
+	return(_storeSystems(systems, appVersion, sortMode))
 
-	allSystems = []
-	for system in systems["all"]:
-
-		# Convert Empty Strings To None Objects
-		for parameter in system.keys():
-			if system[parameter] == '':
-				system[parameter] = None
-
-		# Check all keys exist
-		for key in ["goAgencyName", "email", "email", "goTestMode", "name2", "homepage", "logo", "goRoutePlannerEnabled", "goColor", "goSupportEmail", "goSharedCode", "goAuthenticationType"]:
-			if key not in system.keys():
-				system[key] = None
-
-		allSystems.append(TransportationSystem(
-			id = int(system["id"]),
-			name = system["fullname"],
-			username = system["username"],
-			goAgencyName = system["goAgencyName"],
-			email = system["email"],
-			goTestMode = bool(int(system["goTestMode"])),
-			name2 = bool(int(system["name2"])),
-			homepage = system["homepage"],
-			logo = bool(int(system["logo"])),
-			goRoutePlannerEnabled = bool(int(system["goRoutePlannerEnabled"])),
-			goColor = system["goColor"],
-			goSupportEmail = system["goSupportEmail"],
-			goSharedCode = toIntInclNone(system["goSharedCode"]),
-			goAuthenticationType = bool(int(system["goAuthenticationType"])),
-		))
+
+def _getSystemsFromCache(
+	appVersion: int,
+	sortMode: int
+) -> Optional[List[TransportationSystem]]:
+	"""
+	Get the list of systems from the memory cache, or else from the disk cache.
+
+	Shared by getSystems() and passiogo.aclient.getSystems().
+
+	Args:
+		appVersion: API version the systems were requested with
+		sortMode: Sorting mode the systems were requested with
+
+	Returns:
+		Copy of the cached list of TransportationSystem objects, or None on cache miss
+	"""
+
+	# Return Cached Systems
+	cachedSystems = _getCachedSystems(appVersion, sortMode)
+	if(cachedSystems is not None):
+		return(cachedSystems)
+
+
+	# Return Systems Cached On Disk
+	diskCache = _readSystemsDiskCache(appVersion, sortMode)
+	if(diskCache is None):
+		return(None)
+
+	allSystems = _parseSystems(diskCache["data"])
+	_cacheSystems(allSystems, appVersion, sortMode, diskCache["fetchedAt"])
+	return(list(allSystems))
+
+
+def _storeSystems(
+	systems: dict,
+	appVersion: int,
+	sortMode: int
+) -> List[TransportationSystem]:
+	"""
+	Parse a getSystems API response and cache it, in memory and on disk.
+
+	Shared by getSystems() and passiogo.aclient.getSystems().
+
+	Args:
+		systems: JSON response from the API
+		appVersion: API version the systems were requested with
+		sortMode: Sorting mode the systems were requested with
+
+	Returns:
+		Copy of the cached list of TransportationSystem objects
+	"""
+	allSystems = _parseSystems(systems)
+	_cacheSystems(allSystems, appVersion, sortMode)
+	_writeSystemsDiskCache(systems, appVersion, sortMode)
+	return(list(allSystems))
+
+
+def _getCachedSystems(
+	appVersion: int,
+	sortMode: int
+) -> Optional[List[TransportationSystem]]:
+	"""
+	Get the cached list of systems if it is still fresh.
+
+	Args:
+		appVersion: API version the systems were requested with
+		sortMode: Sorting mode the systems were requested with
+
+	Returns:
+		Copy of the cached list of TransportationSystem objects, or None on cache miss
+	"""
+	if(
+		_systemsCache["data"] is not None and
+		_systemsCache["appVersion"] == appVersion and
+		_systemsCache["sortMode"] == sortMode and
+		time.monotonic() - _systemsCache["ts"] < _SYSTEMS_TTL
+	):
+		return(list(_systemsCache["data"]))
+	return(None)
+
+
+def _cacheSystems(
+	allSystems: List[TransportationSystem],
+	appVersion: int,
+	sortMode: int,
+	fetchedAt: Optional[float] = None
+):
+	"""
+	Store a list of systems in the systems cache.
+
+	Args:
+		allSystems: List of TransportationSystem objects
+		appVersion: API version the systems were requested with
+		sortMode: Sorting mode the systems were requested with
+		fetchedAt: Unix time the systems were fetched at (default: now)
+	"""
+	now = time.time()
+	if fetchedAt is None:
+		fetchedAt = now
+
+	_systemsCache.update({
+		"ts": time.monotonic() - (now - fetchedAt),
+		"fetchedAt": fetchedAt,
+		"appVersion": appVersion,
+		"sortMode": sortMode,
+		"data": allSystems,
+		"byId": {system.id: system for system in allSystems},
+	})
+
+
+def _readSystemsDiskCache(
+	appVersion: int,
+	sortMode: int
+) -> Optional[dict]:
+	"""
+	Read the systems response cached on disk if it is still fresh.
+
+	Args:
+		appVersion: API version the systems were requested with
+		sortMode: Sorting mode the systems were requested with
+
+	Returns:
+		dict: {"fetchedAt", "appVersion", "sortMode", "data"}, or None if
+		      there is no matching fresh cache or it cannot be read
+	"""
+	try:
+		with open(_SYSTEMS_CACHE_FILE, "rb") as f:
+			diskCache = _loadJson(f.read())
+	except (OSError, ValueError):
+		return(None)
+
+	if(
+		not isinstance(diskCache, dict) or
+		diskCache.get("appVersion") != appVersion or
+		diskCache.get("sortMode") != sortMode or
+		not isinstance(diskCache.get("fetchedAt"), (int, float)) or
+		not 0 <= time.time() - diskCache["fetchedAt"] < _SYSTEMS_TTL or
+		not isinstance(diskCache.get("data"), dict)
+	):
+		return(None)
+
+	return(diskCache)
+
+
+def _writeSystemsDiskCache(
+	systems: dict,
+	appVersion: int,
+	sortMode: int
+):
+	"""
+	Cache a systems response on disk.
+
+	The file is written to a temporary file first and then moved in place, so
+	other processes never read a partially written cache. Errors are ignored,
+	as the cache is only an optimization.
+
+	Args:
+		systems: JSON response from the API
+		appVersion: API version the systems were requested with
+		sortMode: Sorting mode the systems were requested with
+	"""
+	diskCache = {
+		"fetchedAt": time.time(),
+		"appVersion": appVersion,
+		"sortMode": sortMode,
+		"data": systems,
+	}
+
+	try:
+		os.makedirs(_CACHE_DIR, exist_ok = True)
+		fd, tmpPath = tempfile.mkstemp(dir = _CACHE_DIR, prefix = "systems.", suffix = ".tmp")
+		try:
+			with os.fdopen(fd, "w") as f:
+				json.dump(diskCache, f)
+			os.replace(tmpPath, _SYSTEMS_CACHE_FILE)
+		except BaseException:
+			os.remove(tmpPath)
+			raise
+	except (OSError, TypeError, ValueError):
+		pass
+
+
+def _parseSystems(systems: dict) -> List[TransportationSystem]:
+	"""
+	Convert a getSystems API response into TransportationSystem objects.
+
+	Args:
+		systems: JSON response from the API
+
+	Returns:
+		List of TransportationSystem objects
+	"""
+	return([_parseSystem(system) for system in systems["all"]])
 
 
-	return(allSystems)
+def _parseSystem(system: dict) -> TransportationSystem:
+	"""
+	Convert a single system record of a getSystems API response into a TransportationSystem object.
+
+	Args:
+		system: System record from the API
+
+	Returns:
+		TransportationSystem object
+	"""
+	get = system.get
+
+	# Empty strings are read as None
+	obj = TransportationSystem._new()
+	obj.id = toIntInclNone(_nonEmpty(get("id")))
+	obj.name = _nonEmpty(get("fullname"))
+	obj.username = _nonEmpty(get("username"))
+	obj.goAgencyName = _nonEmpty(get("goAgencyName"))
+	obj.email = _nonEmpty(get("email"))
+	obj.goTestMode = _intToBoolInclNone(_nonEmpty(get("goTestMode")))
+	obj.name2 = _intToBoolInclNone(_nonEmpty(get("name2")))
+	obj.homepage = _nonEmpty(get("homepage"))
+	obj.logo = _intToBoolInclNone(_nonEmpty(get("logo")))
+	obj.goRoutePlannerEnabled = _intToBoolInclNone(_nonEmpty(get("goRoutePlannerEnabled")))
+	obj.goColor = _intern(_nonEmpty(get("goColor")))
+	obj.goSupportEmail = _nonEmpty(get("goSupportEmail"))
+	obj.goSharedCode = toIntInclNone(_nonEmpty(get("goSharedCode")))
+	obj.goAuthenticationType = _intToBoolInclNone(_nonEmpty(get("goAuthenticationType")))
+
+	if _VALIDATE:
+		obj.checkTypes()
+	return(obj)
 
 
 def getSystemFromID(
@@ -163,7 +722,7 @@ def getSystemFromID(
 		TransportationSystem object if found, None otherwise
 
 	Raises:
-		AssertionError: If parameter types are incorrect
+		TypeError: If parameter types are incorrect
 
 	Example:
 		>>> system = passiogo.getSystemFromID(1270)
@@ -172,20 +731,62 @@ def getSystemFromID(
 	"""
 
 	# Check Input Type
-	assert type(id) == int, "`id` must be of type int"
+	id = _checkInt(id, "`id` must be of type int")
 
 	# Check App Version Type
-	assert type(appVersion) == int, "`appVersion` must be of type int"
+	appVersion = _checkInt(appVersion, "`appVersion` must be of type int")
 
 	# Check sort Mode Type
-	assert type(sortMode) == int, "`sortMode` must be of type int"
+	sortMode = _checkInt(sortMode, "`sortMode` must be of type int")
 
-	systems = getSystems(appVersion,sortMode)
+	# Refresh Cache If Needed
+	getSystems(appVersion,sortMode)
 
-	for system in systems:
-		if system.id == id:
-			return system
-	return None
+	return(_systemsCache["byId"].get(id))
+
+
+def getSystemsFromIDs(
+	ids: List[int],
+	appVersion: int = 2,
+	sortMode: int = 1,
+) -> Dict[int, Optional[TransportationSystem]]:
+	"""
+	Get several transportation systems by their IDs at once.
+
+	The list of systems is fetched (or read from the cache) a single time for
+	all IDs, so this should be preferred over calling getSystemFromID() in a loop.
+
+	Args:
+		ids: The unique system identifiers
+		appVersion: API version to use (default: 2)
+		sortMode: Sorting mode for results (default: 1)
+
+	Returns:
+		Dictionary mapping each ID to its TransportationSystem object, or to None if not found
+
+	Raises:
+		TypeError: If parameter types are incorrect
+
+	Example:
+		>>> systems = passiogo.getSystemsFromIDs([1270, 1068])
+		>>> print(systems[1068].name)
+		'University of Chicago'
+	"""
+
+	# Check Input Types
+	ids = [_checkInt(id, "`ids` must only contain values of type int") for id in ids]
+
+	# Check App Version Type
+	appVersion = _checkInt(appVersion, "`appVersion` must be of type int")
+
+	# Check sort Mode Type
+	sortMode = _checkInt(sortMode, "`sortMode` must be of type int")
+
+	# Refresh Cache If Needed
+	getSystems(appVersion,sortMode)
+
+	systemsById = _systemsCache["byId"]
+	return({id: systemsById.get(id) for id in ids})
 
 
 def printAllSystemsMd(
@@ -250,51 +851,78 @@ def getRoutes(
 	if(routes == None):
 		return(None)
 
+	return(_parseRoutes(routes, system))
+
+
+def _parseRoutes(
+	routes: dict,
+	system: TransportationSystem
+) -> List[Route]:
+	"""
+	Convert a getRoutes API response into Route objects.
+
+	Args:
+		routes: JSON response from the API
+		system: The TransportationSystem the response belongs to
+
+	Returns:
+		List of Route objects
+	"""
 
 	# Handle Differing Response Format
 	if "all" in routes:
 		routes = routes["all"]
 
-	allRoutes = []
-	for route in routes:
-		possibleKeys = ["id", "groupId", "groupColor", "name", "shortName", "nameOrig", "fullname", "myid", "mapApp", "archive", "goPrefixRouteName", "goShowSchedule", "outdated", "distance", "latitude", "longitude", "timezone", "serviceTime", "serviceTimeShort"]
-
-		for possibleKey in possibleKeys:
-			if possibleKey not in route.keys():
-				route[possibleKey] = None
-
-		allRoutes.append(Route(
-			id = route["id"],
-			groupId = route["groupId"],
-			groupColor = route["groupColor"],
-			name = route["name"],
-			shortName = route["shortName"],
-			nameOrig = route["nameOrig"],
-			fullname = route["fullname"],
-			myid = route["myid"],
-			mapApp = route["mapApp"],
-			archive = route["archive"],
-			goPrefixRouteName = route["goPrefixRouteName"],
-			goShowSchedule = route["goShowSchedule"],
-			outdated = route["outdated"],
-			distance = route["distance"],
-			latitude = route["latitude"],
-			longitude = route["longitude"],
-			timezone = route["timezone"],
-			serviceTime = route["serviceTime"],
-			serviceTimeShort = route["serviceTimeShort"],
-			systemId = int(route["userId"]),
-			system = system
-		))
+	return([_parseRoute(route, system) for route in routes])
+
+
+def _parseRoute(
+	route: dict,
+	system: TransportationSystem
+) -> Route:
+	"""
+	Convert a single route record of a getRoutes API response into a Route object.
 
-	return(allRoutes)
+	Args:
+		route: Route record from the API
+		system: The TransportationSystem the route belongs to
+
+	Returns:
+		Route object
+	"""
+	get = route.get
+
+	obj = Route._new()
+	obj.id = get("id")
+	obj.groupId = get("groupId")
+	obj.groupColor = _intern(get("groupColor"))
+	obj.name = get("name")
+	obj.shortName = get("shortName")
+	obj.nameOrig = get("nameOrig")
+	obj.fullname = get("fullname")
+	obj.myid = get("myid")
+	obj.mapApp = get("mapApp")
+	obj.archive = get("archive")
+	obj.goPrefixRouteName = get("goPrefixRouteName")
+	obj.goShowSchedule = get("goShowSchedule")
+	obj.outdated = get("outdated")
+	obj.distance = get("distance")
+	obj.latitude = get("latitude")
+	obj.longitude = get("longitude")
+	obj.timezone = _intern(get("timezone"))
+	obj.serviceTime = get("serviceTime")
+	obj.serviceTimeShort = _intern(get("serviceTimeShort"))
+	obj.systemId = toIntInclNone(get("userId"))
+	obj.system = system
+	return(obj)
 
 
 def getStops(
 	system: TransportationSystem,
 	appVersion: int = 2,
 	sA: int = 1,
-	raw: bool = False
+	raw: bool = False,
+	stream: bool = False
 ) -> List[Stop]:
 	"""
 	Get all stops for a transportation system.
@@ -308,6 +936,8 @@ def getStops(
 		    - 1: Returns all stops for the given system (recommended)
 		    - >=2: Returns all stops plus potentially unrelated stops
 		raw: If True, returns raw API response dict instead of Stop objects
+		stream: If True, parses the response while it is downloaded to reduce
+		        peak memory on very large systems (requires ijson, ignored if raw=True)
 
 	Returns:
 		List of Stop objects, or dict if raw=True
@@ -327,64 +957,203 @@ def getStops(
 		"s0" : str(system.id),
 		"sA" : sA
 	}
+
+	# Stream Large Responses
+	if stream and not raw:
+		return(_streamStops(url, body, system))
+
 	stops = sendApiRequest(url, body)
 
 	# Return Raw Response
+	# (copied, the parsed response is shared with the response cache)
 	if raw:
-		return(stops)
+		return(copy.deepcopy(stops))
 
 	# Handle Request Error
 	if(stops == None):
 		return(None)
 
-	# Handle Empty Routes
-	if stops["routes"] == []:
-		stops["routes"] = {}
+	return(_parseStops(stops, system))
 
-	# Handle Empty Stops
-	if stops["stops"] == []:
-		stops["stops"] = {}
 
+def _indexRoutesByStop(routes: dict) -> dict:
+	"""
+	Index the positions of every stop on every route, in a single pass over the routes.
 
-	# Create Route & Stops Dictionary
-	# {routeid -> [stopid, stopid]}
-	routesAndStops = {}
-	for routeId, route in stops["routes"].items():
-		routesAndStops[routeId] = []
-		for stop in route[2:]:
-			if stop == 0:
-				continue
-			routesAndStops[routeId].append(stop[1])
+	Args:
+		routes: The "routes" mapping of a getStops API response
+		        Format: {routeId: [name, color, [_, stopId], ..., 0, ...]}
+
+	Returns:
+		dict: {stopId: {routeId: [position1, position2, ...]}}
+	"""
+	index = {}
+	for routeId, route in routes.items():
+		# Skip the route name & color, and the 0 separators
+		routeStops = [stop[1] for stop in itertools.islice(route, 2, None) if stop != 0]
+		for position, stopId in enumerate(routeStops):
+			index.setdefault(stopId, {}).setdefault(routeId, []).append(position)
+	return(index)
+
+
+def _parseStops(
+	stops: dict,
+	system: TransportationSystem
+) -> List[Stop]:
+	"""
+	Convert a getStops API response into Stop objects.
+
+	Args:
+		stops: JSON response from the API
+		system: The TransportationSystem the response belongs to
+
+	Returns:
+		List of Stop objects
+	"""
+
+	# Handle Empty Routes & Stops
+	# (sent as [] or null instead of {})
+	routes = stops.get("routes") or {}
+	stops = stops.get("stops") or {}
+
+
+	# Create Stop, Routes & Positions Dictionary
+	# {stopid -> {routeid -> [position]}}
+	stopsRoutesAndPositions = _indexRoutesByStop(routes)
 
 
 	# Create Each Stop Object
+	return([
+		_parseStop(stop, stopsRoutesAndPositions.get(stop["id"], {}), system)
+		for stop in stops.values()
+	])
+
+
+def _parseStop(
+	stop: dict,
+	routesAndPositions: dict,
+	system: TransportationSystem
+) -> Stop:
+	"""
+	Convert a single stop record of a getStops API response into a Stop object.
+
+	Args:
+		stop: Stop record from the API
+		routesAndPositions: Mapping of route IDs to positions of the stop on each route
+		system: The TransportationSystem the stop belongs to
+
+	Returns:
+		Stop object
+	"""
+	get = stop.get
+
+	obj = Stop._new()
+	obj.id = get("id")
+	obj.routesAndPositions = routesAndPositions
+	obj.systemId = toIntInclNone(get("userId"))
+	obj.name = get("name")
+	obj.latitude = get("latitude")
+	obj.longitude = get("longitude")
+	obj.radius = get("radius")
+	obj.system = system
+	return(obj)
+
+
+def _streamStops(
+	url: str,
+	body: dict,
+	system: TransportationSystem
+) -> List[Stop]:
+	"""
+	Request stops and build Stop objects while the response is being downloaded.
+
+	Streamed responses bypass the response cache.
+
+	Args:
+		url: Full API endpoint URL
+		body: JSON body to send
+		system: The TransportationSystem to query
+
+	Returns:
+		List of Stop objects
+
+	Raises:
+		ImportError: If ijson is not installed
+		Exception: If API returns an error response
+	"""
+	if ijson is None:
+		raise ImportError("Streaming stops requires ijson. Install it with `pip install passiogo[stream]`")
+
+	with _SESSION.post(url, json = body, timeout = REQUEST_TIMEOUT, stream = True) as response:
+		response.raw.decode_content = True
+		return(_parseStopsStream(response.raw, system))
+
+
+def _parseStopsStream(
+	stream,
+	system: TransportationSystem
+) -> List[Stop]:
+	"""
+	Convert a getStops API response into Stop objects while it is being read.
+
+	The response is parsed incrementally with ijson, so each stop record is
+	turned into a Stop object and discarded as soon as it is read, instead of
+	keeping the whole response and its parsed copy in memory. Routes may be
+	sent before or after the stops, so positions are attached once the whole
+	response has been read.
+
+	Args:
+		stream: Binary file-like object returning the JSON response
+		system: The TransportationSystem the response belongs to
+
+	Returns:
+		List of Stop objects
+
+	Raises:
+		Exception: If API returns an error response
+	"""
+	routes = {}
+	routesBuilder = None
 	allStops = []
-	for id, stop in stops["stops"].items():
-
-		# Create Route & Positions Dictionary
-		# {routeid -> [position]}
-		routesAndPositions = {}
-		for routeId in routesAndStops.keys():
-			if stop["id"] not in routesAndStops[routeId]:
-				continue
-			routesAndPositions[routeId] = [i for i,x in enumerate(routesAndStops[routeId]) if x == stop["id"]]
-
-
-		keys = ["userId", "radius"]
-		for key in keys:
-			if key not in stop:
-				stop[key] = None
-
-		allStops.append(Stop(
-			id = stop["id"],
-			routesAndPositions = routesAndPositions,
-			systemId = None if stop["userId"] is None else int(stop["userId"]),
-			name = stop["name"],
-			latitude = stop["latitude"],
-			longitude = stop["longitude"],
-			radius = stop["radius"],
-			system = system,
-		))
+	stopPrefix = None
+	stopBuilder = None
+
+	for prefix, event, value in ijson.parse(stream, use_float = True):
+
+		# Handle API Error
+		if prefix == "error" and value:
+			raise Exception(f"Error in Response! Here is the received error: {value}")
+
+		# Build Routes
+		# (null or any other scalar is read as no routes)
+		if prefix == "routes" or prefix.startswith("routes."):
+			if prefix == "routes" and event in ("start_map", "start_array"):
+				routesBuilder = ijson.ObjectBuilder()
+			if routesBuilder is not None:
+				routesBuilder.event(event, value)
+				if prefix == "routes" and event in ("end_map", "end_array"):
+					routes = routesBuilder.value or {}
+					routesBuilder = None
+			continue
+
+		# Start New Stop
+		if prefix == "stops" and event == "map_key":
+			stopPrefix = f"stops.{value}"
+			stopBuilder = ijson.ObjectBuilder()
+			continue
+
+		# Build Stop
+		if stopBuilder is not None and (prefix == stopPrefix or prefix.startswith(stopPrefix + ".")):
+			stopBuilder.event(event, value)
+			if prefix == stopPrefix and event == "end_map":
+				allStops.append(_parseStop(stopBuilder.value, {}, system))
+				stopBuilder = None
+
+
+	# Attach Routes & Positions
+	stopsRoutesAndPositions = _indexRoutesByStop(routes)
+	for stop in allStops:
+		stop.routesAndPositions = stopsRoutesAndPositions.get(stop.id, {})
 
 	return(allStops)
 
@@ -435,42 +1204,75 @@ def getSystemAlerts(
 	if(errorMsgs == None):
 		return(None)
 
+	return(_parseSystemAlerts(errorMsgs, system))
+
+
+def _parseSystemAlerts(
+	errorMsgs: dict,
+	system: TransportationSystem
+) -> List[SystemAlert]:
+	"""
+	Convert a getAlertMessages API response into SystemAlert objects.
+
+	Args:
+		errorMsgs: JSON response from the API
+		system: The TransportationSystem the response belongs to
+
+	Returns:
+		List of SystemAlert objects
+	"""
+
 	# Create SystemAlert Objects
-	allAlerts = []
-	for errorMsg in errorMsgs["msgs"]:
-		allAlerts.append(SystemAlert(
-			id = errorMsg["id"],
-			systemId = errorMsg["userId"],
-			system = system,
-			routeId = errorMsg["routeId"],
-			name = errorMsg["name"],
-			html = errorMsg["html"],
-			archive = errorMsg["archive"],
-			important = errorMsg["important"],
-			dateTimeCreated = errorMsg["created"],
-			dateTimeFrom = errorMsg["from"],
-			dateTimeTo = errorMsg["to"],
-			asPush = errorMsg["asPush"],
-			gtfs = errorMsg["gtfs"],
-			gtfsAlertCauseId = errorMsg["gtfsAlertCauseId"],
-			gtfsAlertEffectId = errorMsg["gtfsAlertEffectId"],
-			gtfsAlertUrl = errorMsg["gtfsAlertUrl"],
-			gtfsAlertHeaderText = errorMsg["gtfsAlertHeaderText"],
-			gtfsAlertDescriptionText = errorMsg["gtfsAlertDescriptionText"],
-			routeGroupId = errorMsg["routeGroupId"],
-			createdUtc = errorMsg["createdUtc"],
-			authorId = errorMsg["authorId"],
-			author = errorMsg["author"],
-			updated = errorMsg["updated"],
-			updateAuthorId = errorMsg["updateAuthorId"],
-			updateAuthor = errorMsg["updateAuthor"],
-			createdF = errorMsg["createdF"],
-			fromF = errorMsg["fromF"],
-			fromOk = errorMsg["fromOk"],
-			toOk = errorMsg["toOk"],
-		))
+	return([_parseSystemAlert(errorMsg, system) for errorMsg in errorMsgs["msgs"]])
+
 
-	return(allAlerts)
+def _parseSystemAlert(
+	errorMsg: dict,
+	system: TransportationSystem
+) -> SystemAlert:
+	"""
+	Convert a single alert record of a getAlertMessages API response into a SystemAlert object.
+
+	Args:
+		errorMsg: Alert record from the API
+		system: The TransportationSystem the alert belongs to
+
+	Returns:
+		SystemAlert object
+	"""
+	get = errorMsg.get
+
+	obj = SystemAlert._new()
+	obj.id = get("id")
+	obj.systemId = get("userId")
+	obj.system = system
+	obj.routeId = get("routeId")
+	obj.name = get("name")
+	obj.html = get("html")
+	obj.archive = get("archive")
+	obj.important = get("important")
+	obj.dateTimeCreated = get("created")
+	obj.dateTimeFrom = get("from")
+	obj.dateTimeTo = get("to")
+	obj.asPush = get("asPush")
+	obj.gtfs = get("gtfs")
+	obj.gtfsAlertCauseId = get("gtfsAlertCauseId")
+	obj.gtfsAlertEffectId = get("gtfsAlertEffectId")
+	obj.gtfsAlertUrl = get("gtfsAlertUrl")
+	obj.gtfsAlertHeaderText = get("gtfsAlertHeaderText")
+	obj.gtfsAlertDescriptionText = get("gtfsAlertDescriptionText")
+	obj.routeGroupId = get("routeGroupId")
+	obj.createdUtc = get("createdUtc")
+	obj.authorId = get("authorId")
+	obj.author = get("author")
+	obj.updated = get("updated")
+	obj.updateAuthorId = get("updateAuthorId")
+	obj.updateAuthor = get("updateAuthor")
+	obj.createdF = get("createdF")
+	obj.fromF = get("fromF")
+	obj.fromOk = get("fromOk")
+	obj.toOk = get("toOk")
+	return(obj)
 
 
 def getVehicles(
@@ -481,6 +1283,8 @@ def getVehicles(
 	Get all currently active vehicles for a transportation system.
 
 	Returns real-time vehicle positions, routes, and status information.
+	While a live feed is connected for the system (see passiogo.launchWS()),
+	the vehicles it keeps up to date are returned without an API request.
 
 	Args:
 		system: The TransportationSystem to query
@@ -506,6 +1310,11 @@ def getVehicles(
 		...     print(f"  Passenger load: {vehicle.paxLoad}%")
 	"""
 
+	# Return Live Vehicles
+	liveVehicles = _liveVehicles.get(system.id)
+	if(liveVehicles is not None):
+		return(list(liveVehicles.values()))
+
 
 	# Initialize & Send Request
 	url = BASE_URL+"/mapGetData.php?getBuses="+str(appVersion)
@@ -519,42 +1328,158 @@ def getVehicles(
 	if(vehicles == None):
 		return(None)
 
-	allVehicles = []
-	for vehicleId, vehicle in vehicles["buses"].items():
-		if vehicleId == '-1':
-			continue
+	return(_parseVehicles(vehicles, system))
+
+
+def _parseVehicles(
+	vehicles: dict,
+	system: TransportationSystem
+) -> List[Vehicle]:
+	"""
+	Convert a getBuses API response into Vehicle objects.
 
-		vehicle = vehicle[0]
+	Args:
+		vehicles: JSON response from the API
+		system: The TransportationSystem the response belongs to
+
+	Returns:
+		List of Vehicle objects
+	"""
+
+	return([
+		_parseVehicle(vehicle[0], system)
+		for vehicleId, vehicle in vehicles["buses"].items()
+		if vehicleId != '-1'
+	])
 
-		for key in ["busId", "busName", "busType", "calculatedCourse", "routeId", "route", "color", "created", "latitude", "longitude", "speed", "paxLoad100", "outOfService", "more", "tripId"]:
-			if key not in vehicle:
-				vehicle[key] = None
 
+def _parseVehicle(
+	vehicle: dict,
+	system: TransportationSystem
+) -> Vehicle:
+	"""
+	Convert a single bus record of a getBuses API response into a Vehicle object.
 
-		allVehicles.append(Vehicle(
-			id = vehicle["busId"],
-			name = vehicle["busName"],
-			type = vehicle["busType"],
+	Args:
+		vehicle: Bus record from the API
+		system: The TransportationSystem the vehicle belongs to
+
+	Returns:
+		Vehicle object
+	"""
+	get = vehicle.get
+
+	obj = Vehicle._new()
+	obj.id = get("busId")
+	obj.name = get("busName")
+	obj.type = _intern(get("busType"))
+	obj.system = system
+	obj.calculatedCourse = get("calculatedCourse")
+	obj.routeId = get("routeId")
+	obj.routeName = _intern(get("route"))
+	obj.color = _intern(get("color"))
+	obj.created = get("created")
+	obj.latitude = get("latitude")
+	obj.longitude = get("longitude")
+	obj.speed = get("speed")
+	obj.paxLoad = get("paxLoad100")
+	obj.outOfService = get("outOfService")
+	obj.more = get("more")
+	obj.tripId = get("tripId")
+	return(obj)
+
+
+def getSystemSnapshot(
+	system: TransportationSystem
+) -> SystemSnapshot:
+	"""
+	Get the routes, stops, alerts and vehicles of a transportation system at once.
+
+	The four requests are independent, so they are sent concurrently from a
+	thread pool instead of one after the other.
+
+	Args:
+		system: The TransportationSystem to query
+
+	Returns:
+		SystemSnapshot with the routes, stops, alerts and vehicles of the system
+
+	Note:
+		All threads share the module's requests.Session. Sending requests
+		concurrently through it is safe, but the session itself (headers,
+		cookies, adapters) should not be modified while a snapshot is running.
+
+	Example:
+		>>> system = passiogo.getSystemFromID(1270)
+		>>> snapshot = passiogo.getSystemSnapshot(system)
+		>>> for vehicle in snapshot.vehicles:
+		...     print(f"Vehicle {vehicle.name} on route {vehicle.routeName}")
+	"""
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		routes = executor.submit(system.getRoutes)
+		stops = executor.submit(system.getStops)
+		alerts = executor.submit(system.getSystemAlerts)
+		vehicles = executor.submit(system.getVehicles)
+
+		return(SystemSnapshot(
 			system = system,
-			calculatedCourse = vehicle["calculatedCourse"],
-			routeId = vehicle["routeId"],
-			routeName = vehicle["route"],
-			color = vehicle["color"],
-			created = vehicle["created"],
-			latitude = vehicle["latitude"],
-			longitude = vehicle["longitude"],
-			speed = vehicle["speed"],
-			paxLoad = vehicle["paxLoad100"],
-			outOfService = vehicle["outOfService"],
-			more = vehicle["more"],
-			tripId = vehicle["tripId"],
+			routes = routes.result(),
+			stops = stops.result(),
+			alerts = alerts.result(),
+			vehicles = vehicles.result(),
 		))
 
-	return(allVehicles)
+
+def _instanceTtlCache(ttl: float):
+	"""
+	Cache the results of a TransportationSystem method on the instance.
+
+	Results are stored in the `_cache` dictionary of the system, keyed by the
+	method name and arguments, and reused for `ttl` seconds.
+	TransportationSystem.clearCache() empties it, and passing `refresh=True`
+	to the method bypasses it for one call.
+
+	Only lists of objects are cached, and every call returns a new copy of the
+	list. The cached list itself is returned by the `_shared` attribute of the
+	decorated method, for internal caches keyed on its identity.
+
+	Args:
+		ttl: Number of seconds a result is reused for
+
+	Returns:
+		Decorator to apply to the method
+	"""
+	def decorator(method):
+		name = method.__name__
+
+		def sharedMethod(self, *args, refresh = False, **kwargs):
+			cache = self._cache
+			key = (name, args, tuple(sorted(kwargs.items())))
+
+			# Return Cached Result
+			cached = None if refresh else cache.get(key)
+			if cached is not None and time.monotonic() - cached[0] < ttl:
+				return(cached[1])
+
+			result = method(self, *args, **kwargs)
+			if isinstance(result, list):
+				cache[key] = (time.monotonic(), result)
+			return(result)
+
+		@functools.wraps(method)
+		def cachedMethod(self, *args, **kwargs):
+			result = sharedMethod(self, *args, **kwargs)
+			return(list(result) if isinstance(result, list) else result)
+
+		cachedMethod._shared = sharedMethod
+		return(cachedMethod)
+	return(decorator)
 
 
 # Attach methods to TransportationSystem class
-TransportationSystem.getRoutes = getRoutes
-TransportationSystem.getStops = getStops
-TransportationSystem.getSystemAlerts = getSystemAlerts
-TransportationSystem.getVehicles = getVehicles
+TransportationSystem.getRoutes = _instanceTtlCache(_ROUTES_TTL)(getRoutes)
+TransportationSystem.getStops = _instanceTtlCache(_STOPS_TTL)(getStops)
+TransportationSystem.getSystemAlerts = _instanceTtlCache(_SYSTEM_ALERTS_TTL)(getSystemAlerts)
+TransportationSystem.getVehicles = _instanceTtlCache(_VEHICLES_TTL)(getVehicles)
+TransportationSystem._getSharedStops = TransportationSystem.getStops._shared
+TransportationSystem._getSharedVehicles = TransportationSystem.getVehicles._shared
@@ -0,0 +1,274 @@
+"""
+PassioGo Live Vehicle Feed
+
+Push-based alternative to polling getVehicles(). A WebSocket connection to
+Passio Go receives location updates for individual vehicles as they move,
+instead of downloading the whole fleet on every request.
+
+While the feed is connected, the vehicles it keeps up to date are returned by
+TransportationSystem.getVehicles() without an API request. Vehicles which
+receive no update for VEHICLE_EXPIRY seconds are dropped, as they have
+usually gone out of service.
+
+Example:
+    >>> import passiogo
+    >>>
+    >>> def onUpdate(vehicle):
+    ...     print(f"{vehicle.name}: ({vehicle.latitude}, {vehicle.longitude})")
+    >>>
+    >>> wsapp = passiogo.launchWS(1270, onUpdate, background = True)
+    >>> umich = passiogo.getSystemFromID(1270)
+    >>> vehicles = umich.getVehicles() # Served from the live feed
+    >>> passiogo.getLatencyMs(1270)
+    >>> wsapp.close()
+
+Author: PassioGo Contributors
+License: See LICENSE file
+"""
+
+import json
+import time
+import threading
+import websocket
+from typing import Optional, Callable, Dict
+from .models import TransportationSystem, Vehicle
+from . import client
+
+WS_URL = "wss://passio3.com/"
+
+# Seconds between two WebSocket pings
+PING_INTERVAL = 5
+
+# Seconds after which a vehicle without any update is dropped
+VEHICLE_EXPIRY = 6 * PING_INTERVAL
+
+# Push Frame Fields
+# (attribute, frame key), in the order they are subscribed to
+_LIVE_FIELDS = (
+	("id", "busId"),
+	("latitude", "latitude"),
+	("longitude", "longitude"),
+	("calculatedCourse", "course"),
+	("paxLoad", "paxLoad"),
+	("more", "more"),
+)
+
+# Latest ping/pong round trip per system, in milliseconds
+_latencyMs = {}
+
+
+def launchWS(
+	userId: int,
+	onUpdate: Optional[Callable[[Vehicle], None]] = None,
+	background: bool = False
+) -> websocket.WebSocketApp:
+	"""
+	Launch a WebSocket connection for live vehicle tracking.
+
+	The vehicles of the system are fetched once through the API, then kept up
+	to date with the location updates pushed by the server. Vehicles which
+	receive no update for VEHICLE_EXPIRY seconds are dropped.
+
+	Args:
+		userId: Transportation system ID to subscribe to
+		onUpdate: Function called with each updated Vehicle (optional)
+		background: If True, run the connection in a daemon thread and return
+		            immediately. Otherwise block until it is closed.
+
+	Returns:
+		websocket.WebSocketApp: The connection, call .close() to stop it
+
+	Example:
+		>>> wsapp = passiogo.launchWS(1270, print, background = True)
+		>>> wsapp.close()
+	"""
+
+	# Resolve System
+	system = client.getSystemFromID(userId)
+	if(system is None):
+		system = TransportationSystem(id = userId)
+
+
+	# Seed Vehicles
+	vehicles = {}
+	updatedAt = {}
+	now = time.monotonic()
+	for vehicle in client.getVehicles(system) or []:
+		vehicles[str(vehicle.id)] = vehicle
+		updatedAt[str(vehicle.id)] = now
+
+
+	def onOpen(wsapp):
+		client._liveVehicles[system.id] = vehicles
+		subscribeWS(wsapp, userId)
+
+	def onMessage(wsapp, message):
+		for vehicle in _applyFrame(message, vehicles, updatedAt, system):
+			if onUpdate is not None:
+				onUpdate(vehicle)
+
+	def onPong(wsapp, data):
+		if(wsapp.last_pong_tm >= wsapp.last_ping_tm > 0):
+			_latencyMs[userId] = (wsapp.last_pong_tm - wsapp.last_ping_tm) * 1000
+		_expireVehicles(vehicles, updatedAt, time.monotonic())
+
+	def onClose(wsapp, close_status_code, close_msg):
+		client._liveVehicles.pop(system.id, None)
+		_latencyMs.pop(userId, None)
+		handleWsClose(wsapp, close_status_code, close_msg)
+
+
+	websocket.enableTrace(False) # For Debugging
+	wsapp = websocket.WebSocketApp(
+		WS_URL,
+		on_open = onOpen,
+		on_message = onMessage,
+		on_pong = onPong,
+		on_error = handleWsError,
+		on_close = onClose
+	)
+	runKwargs = {
+		"ping_interval" : PING_INTERVAL,
+		"ping_timeout" : 3,
+	}
+
+	if background:
+		threading.Thread(
+			target = wsapp.run_forever,
+			kwargs = runKwargs,
+			daemon = True
+		).start()
+	else:
+		wsapp.run_forever(**runKwargs)
+
+	return(wsapp)
+
+
+def _applyFrame(
+	message: str,
+	vehicles: Dict[str, Vehicle],
+	updatedAt: Dict[str, float],
+	system: TransportationSystem
+) -> list:
+	"""
+	Apply the location updates of a push frame to the live vehicles.
+
+	Vehicles not seen before are added with the fields of the update only.
+
+	Args:
+		message: Frame received from the WebSocket
+		vehicles: Live vehicles of the system, by vehicle ID
+		updatedAt: time.monotonic() of the last update of each vehicle, by vehicle ID
+		system: The TransportationSystem the vehicles belong to
+
+	Returns:
+		List of the updated Vehicle objects
+	"""
+
+	# Decode Frame
+	try:
+		frame = json.loads(message)
+	except ValueError:
+		return([])
+
+	if isinstance(frame, dict):
+		frame = [frame]
+	elif not isinstance(frame, list):
+		return([])
+
+
+	updated = []
+	now = time.monotonic()
+	for update in frame:
+		if not isinstance(update, dict) or update.get("busId") is None:
+			continue
+
+		vehicleId = str(update["busId"])
+		vehicle = vehicles.get(vehicleId)
+		if(vehicle is None):
+			vehicle = Vehicle(id = vehicleId, system = system)
+			vehicles[vehicleId] = vehicle
+
+		for attribute, key in _LIVE_FIELDS[1:]:
+			if key in update:
+				setattr(vehicle, attribute, update[key])
+		updatedAt[vehicleId] = now
+		updated.append(vehicle)
+
+	return(updated)
+
+
+def _expireVehicles(
+	vehicles: Dict[str, Vehicle],
+	updatedAt: Dict[str, float],
+	now: float
+) -> list:
+	"""
+	Drop the live vehicles which have not been updated for VEHICLE_EXPIRY seconds.
+
+	Args:
+		vehicles: Live vehicles of the system, by vehicle ID
+		updatedAt: time.monotonic() of the last update of each vehicle, by vehicle ID
+		now: Current time.monotonic()
+
+	Returns:
+		List of the dropped Vehicle objects
+	"""
+	expired = [
+		vehicleId for vehicleId, lastUpdate in updatedAt.items()
+		if now - lastUpdate > VEHICLE_EXPIRY
+	]
+
+	dropped = []
+	for vehicleId in expired:
+		del updatedAt[vehicleId]
+		vehicle = vehicles.pop(vehicleId, None)
+		if(vehicle is not None):
+			dropped.append(vehicle)
+	return(dropped)
+
+
+def getLatencyMs(userId: int) -> Optional[float]:
+	"""
+	Get the latest round trip time of the live feed of a system.
+
+	Measured from the WebSocket ping/pong exchange, sent every 5 seconds.
+
+	Args:
+		userId: Transportation system ID of the feed
+
+	Returns:
+		float: Round trip time in milliseconds
+		None: If the feed is not connected or no pong was received yet
+	"""
+	return(_latencyMs.get(userId))
+
+
+def handleWsError(wsapp, error):
+	"""Handle WebSocket errors."""
+	...
+
+
+def handleWsClose(wsapp, close_status_code, close_msg):
+	"""Handle WebSocket close events."""
+	wsapp.close()
+
+
+def subscribeWS(
+	wsapp,
+	userId
+):
+	"""
+	Subscribe to vehicle location updates via WebSocket.
+
+	Args:
+		wsapp: WebSocket app instance
+		userId: Transportation system ID to subscribe to
+	"""
+
+	subscriptionMsg = {
+		"subscribe":"location",
+		"userId":[userId],
+		"field":[key for attribute, key in _LIVE_FIELDS]
+	}
+	wsapp.send(json.dumps(subscriptionMsg))
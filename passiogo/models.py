@@ -13,10 +13,188 @@ Author: PassioGo Contributors
 License: See LICENSE file
 """
 
-from typing import Optional, Dict, List
+from __future__ import annotations
+
+import os
+import sys
+import functools
+from typing import NamedTuple
+
+__all__ = [
+	"TransportationSystem",
+	"Route",
+	"Stop",
+	"SystemAlert",
+	"Vehicle",
+	"SystemSnapshot",
+]
+
+# Runtime Type Validation
+# Checking the type of every attribute of every object is costly when
+# thousands of them are built from API responses, so it only runs when the
+# PASSIOGO_VALIDATE environment variable is set to a value other than "0" or
+# "false" (and never under `python -O`)
+_VALIDATE = __debug__ and os.environ.get("PASSIOGO_VALIDATE", "0").strip().lower() not in ("", "0", "false")
+
+
+def _intern(value):
+	"""
+	Intern a string value, so that equal values share a single object.
+
+	Used for attributes taking a few distinct values across many objects,
+	such as colors and vehicle types.
+
+	Args:
+		value: Value of the attribute
+
+	Returns:
+		The interned string, or `value` unchanged if it is not a string
+	"""
+	if value.__class__ is str:
+		return(sys.intern(value))
+	return(value)
+
+
+def _bad(name: str, valueType: type, types: tuple):
+	"""
+	Raise the error of an attribute with an incorrect type.
+
+	Kept out of the type checks so the message is only built when one fails.
+
+	Args:
+		name: Name of the attribute
+		valueType: Type of the attribute's value
+		types: Accepted types
+
+	Raises:
+		TypeError: Always
+	"""
+	raise TypeError(f"'{name}' parameter must be {' or '.join(t.__name__ for t in types)} not {valueType.__name__}")
+
+
+def _validated(cls):
+	"""
+	Class decorator calling checkTypes() at the end of __init__.
+
+	The check is decided once at import time: without PASSIOGO_VALIDATE, the
+	class is returned unchanged and creating an object costs nothing extra.
+
+	Args:
+		cls: Model class defining checkTypes()
+
+	Returns:
+		The class, with a validating __init__ if validation is enabled
+	"""
+	if not _VALIDATE:
+		return(cls)
+
+	init = cls.__init__
+
+	@functools.wraps(init)
+	def __init__(self, *args, **kwargs):
+		init(self, *args, **kwargs)
+		self.checkTypes()
+
+	cls.__init__ = __init__
+	return(cls)
+
+
+class _Model:
+	"""
+	Base class of all data models.
+
+	Models declare their attributes in `__slots__`, so instances do not carry
+	a per-instance `__dict__`. This keeps large lists of stops or vehicles
+	small in memory and makes attribute access faster.
+	"""
+
+	__slots__ = ()
+
+	# (attribute, accepted types), checked by checkTypes()
+	_FIELD_TYPES = ()
+
+	# (attribute, value) of attributes not read from API records
+	_DEFAULTS = ()
+
+	@classmethod
+	def _new(cls):
+		"""
+		Create an object without calling __init__.
+
+		Used by the API record parsers, which store each field in its slot
+		directly instead of building keyword arguments for __init__. Only the
+		attributes listed in `_DEFAULTS` are set.
+
+		Returns:
+			Object of the class
+		"""
+		obj = cls.__new__(cls)
+		for attribute, value in cls._DEFAULTS:
+			setattr(obj, attribute, value)
+		return(obj)
+
+	def checkTypes(self):
+		"""
+		Validates that all instance attributes have correct types.
+
+		Raises:
+			TypeError: If any attribute has an incorrect type
+		"""
+		for name, types in self._FIELD_TYPES:
+			valueType = getattr(self, name).__class__
+			# Exact class match first, subclasses are rare
+			if valueType not in types and not issubclass(valueType, types):
+				_bad(name, valueType, types)
+
+	def _key(self) -> tuple:
+		"""
+		Key identifying the object in __eq__() and __hash__().
+
+		Returns:
+			tuple: ID of the parent system (None for systems themselves and
+			       objects without a system) and ID of the object
+		"""
+		system = getattr(self, "system", None)
+		return((None if system is None else system.id, self.id))
 
+	def __eq__(self, other) -> bool:
+		"""
+		Objects of the same model are equal if they have the same ID and
+		belong to the same system.
+
+		Objects without an ID are only equal to themselves.
+		"""
+		if self is other:
+			return(True)
+		if other.__class__ is not self.__class__:
+			return(NotImplemented)
+		return(self.id is not None and self._key() == other._key())
 
-class TransportationSystem:
+	def __hash__(self) -> int:
+		"""
+		Hash of the object, consistent with __eq__().
+		"""
+		if self.id is None:
+			return(object.__hash__(self))
+		return(hash((self.__class__,) + self._key()))
+
+	@property
+	def __dict__(self) -> dict:
+		"""
+		Mapping of attribute names to values, for compatibility with `vars()`.
+
+		Returns:
+			dict: Copy of the public attributes of the object
+		"""
+		return({
+			name: getattr(self, name)
+			for name in type(self).__slots__
+			if not name.startswith("_") and hasattr(self, name)
+		})
+
+
+@_validated
+class TransportationSystem(_Model):
 	"""
 	Represents a Passio Go transportation system (university, municipality, airport, etc.).
 
@@ -47,22 +225,66 @@ class TransportationSystem:
 		>>> vehicles = system.getVehicles()
 	"""
 
+	__slots__ = (
+		"id",
+		"name",
+		"username",
+		"goAgencyName",
+		"email",
+		"goTestMode",
+		"name2",
+		"homepage",
+		"logo",
+		"goRoutePlannerEnabled",
+		"goColor",
+		"goSupportEmail",
+		"goSharedCode",
+		"goAuthenticationType",
+		"_cache",
+		"_stopRouteIndex",
+		"_coordinates",
+	)
+
+	# (attribute, accepted types), checked by checkTypes()
+	_FIELD_TYPES = (
+		("id", (int,)),
+		("name", (str, type(None))),
+		("username", (str, type(None))),
+		("goAgencyName", (str, type(None))),
+		("email", (str, type(None))),
+		("goTestMode", (bool, type(None))),
+		("name2", (bool, type(None))),
+		("homepage", (str, type(None))),
+		("logo", (bool, type(None))),
+		("goRoutePlannerEnabled", (bool, type(None))),
+		("goColor", (str, type(None))),
+		("goSupportEmail", (str, type(None))),
+		("goSharedCode", (int, type(None))),
+		("goAuthenticationType", (bool, type(None))),
+	)
+
+	# _cache is set by __init__ and _new(): a dict here would be shared by all systems
+	_DEFAULTS = (
+		("_stopRouteIndex", None),
+		("_coordinates", None),
+	)
+
 	def __init__(
 		self,
 		id: int,
-		name: Optional[str] = None,
-		username: Optional[str] = None,
-		goAgencyName: Optional[str] = None,
-		email: Optional[str] = None,
-		goTestMode: Optional[bool] = None,
-		name2: Optional[bool] = None,
-		homepage: Optional[str] = None,
-		logo: Optional[bool] = None,
-		goRoutePlannerEnabled: Optional[bool] = None,
-		goColor: Optional[str] = None,
-		goSupportEmail: Optional[str] = None,
-		goSharedCode: Optional[int] = None,
-		goAuthenticationType: Optional[bool] = None
+		name: str | None = None,
+		username: str | None = None,
+		goAgencyName: str | None = None,
+		email: str | None = None,
+		goTestMode: bool | None = None,
+		name2: bool | None = None,
+		homepage: str | None = None,
+		logo: bool | None = None,
+		goRoutePlannerEnabled: bool | None = None,
+		goColor: str | None = None,
+		goSupportEmail: str | None = None,
+		goSharedCode: int | None = None,
+		goAuthenticationType: bool | None = None
 	):
 		"""
 		Initialize a TransportationSystem instance.
@@ -72,7 +294,8 @@ class TransportationSystem:
 			All other parameters are optional system metadata
 
 		Raises:
-			AssertionError: If any parameter type is incorrect
+			TypeError: If any parameter type is incorrect (only checked when
+			           the PASSIOGO_VALIDATE environment variable is set)
 		"""
 		self.id = id
 		self.name = name
@@ -84,64 +307,74 @@ class TransportationSystem:
 		self.homepage = homepage
 		self.logo = logo
 		self.goRoutePlannerEnabled = goRoutePlannerEnabled
-		self.goColor = goColor
+		self.goColor = _intern(goColor)
 		self.goSupportEmail = goSupportEmail
 		self.goSharedCode = goSharedCode
 		self.goAuthenticationType = goAuthenticationType
 
-		self.checkTypes()
-
-	def checkTypes(self):
-		"""
-		Validates that all instance attributes have correct types.
-
-		Raises:
-			AssertionError: If any attribute has an incorrect type
-		"""
-		# id : int
-		assert type(self.id) == int, f"'id' parameter must be an int not {type(self.id)}"
-
-		# name : str or None
-		assert (type(self.name) == str or self.name is None), f"'name' parameter must be a str not {type(self.name)}"
-
-		# username : str or None
-		assert (type(self.username) == str or self.username is None), f"'username' parameter must be a str not {type(self.username)}"
-
-		# goAgencyName : str or None
-		assert (type(self.goAgencyName) == str or self.goAgencyName is None), f"'goAgencyName' parameter must be a str not {type(self.goAgencyName)}"
-
-		# email : str or None
-		assert (type(self.email) == str or self.email is None), f"'email' parameter must be a str not {type(self.email)}"
+		# Cached results of getRoutes(), getStops(), ...
+		self._cache = {}
 
-		# goTestMode : bool or None
-		assert (type(self.goTestMode) == bool or self.goTestMode is None), f"'goTestMode' parameter must be a bool not {type(self.goTestMode)}"
+		# (stops, {routeId -> stops of the route}), see _getStopRouteIndex()
+		self._stopRouteIndex = None
 
-		# name2 : bool or None
-		assert (type(self.name2) == bool or self.name2 is None), f"'name2' parameter must be a bool not {type(self.name2)}"
+		# Coordinate arrays of the stops and vehicles, see passiogo.spatial
+		self._coordinates = None
 
-		# homepage : str or None
-		assert (type(self.homepage) == str or self.homepage is None), f"'homepage' parameter must be a str not {type(self.homepage)}"
-
-		# logo : bool or None
-		assert (type(self.logo) == bool or self.logo is None), f"'logo' parameter must be a bool not {type(self.logo)}"
+	@classmethod
+	def _new(cls):
+		"""
+		Create a system without calling __init__, see _Model._new().
 
-		# goRoutePlannerEnabled : bool or None
-		assert (type(self.goRoutePlannerEnabled) == bool or self.goRoutePlannerEnabled is None), f"'goRoutePlannerEnabled' parameter must be a bool not {type(self.goRoutePlannerEnabled)}"
+		Returns:
+			TransportationSystem object
+		"""
+		obj = super()._new()
+		obj._cache = {}
+		return(obj)
 
-		# goColor : str or None
-		assert (type(self.goColor) == str or self.goColor is None), f"'goColor' parameter must be a str not {type(self.goColor)}"
+	def clearCache(self):
+		"""
+		Clear the cached routes, stops, alerts and vehicles of this system.
 
-		# goSupportEmail : str or None
-		assert (type(self.goSupportEmail) == str or self.goSupportEmail is None), f"'goSupportEmail' parameter must be a str not {type(self.goSupportEmail)}"
+		The next call to each method will query the API again.
+		"""
+		self._cache = {}
+		self._stopRouteIndex = None
+		self._coordinates = None
 
-		# goSharedCode : int or None
-		assert (type(self.goSharedCode) == int or self.goSharedCode is None), f"'goSharedCode' parameter must be a int not {type(self.goSharedCode)}"
+	def _getStopRouteIndex(self, stops: list[Stop]) -> dict[str, list[Stop]]:
+		"""
+		Get the stops served by each route.
 
-		# goAuthenticationType : bool or None
-		assert (type(self.goAuthenticationType) == bool or self.goAuthenticationType is None), f"'goAuthenticationType' parameter must be a bool not {type(self.goAuthenticationType)}"
+		Built once per cached list of stops (see _getSharedStops()) and reused
+		by Route.getStops() for every route of the system. The index holds the
+		Stop objects themselves, so reordering that list does not affect it.
 
+		Args:
+			stops: List of Stop objects returned by _getSharedStops()
 
-class Route:
+		Returns:
+			dict: Stops served by each route ID, in the order of `stops`
+		"""
+		cached = self._stopRouteIndex
+		if cached is not None and cached[0] is stops:
+			return(cached[1])
+
+		index = {}
+		getStops = index.get
+		for stop in stops:
+			for routeId in stop.routesAndPositions:
+				routeStops = getStops(routeId)
+				if routeStops is None:
+					index[routeId] = [stop]
+				else:
+					routeStops.append(stop)
+
+		self._stopRouteIndex = (stops, index)
+		return(index)
+
+class Route(_Model):
 	"""
 	Represents a transit route within a transportation system.
 
@@ -178,29 +411,53 @@ class Route:
 		...     stops = route.getStops()
 	"""
 
+	__slots__ = (
+		"id",
+		"groupId",
+		"groupColor",
+		"name",
+		"shortName",
+		"nameOrig",
+		"fullname",
+		"myid",
+		"mapApp",
+		"archive",
+		"goPrefixRouteName",
+		"goShowSchedule",
+		"outdated",
+		"distance",
+		"latitude",
+		"longitude",
+		"timezone",
+		"serviceTime",
+		"serviceTimeShort",
+		"systemId",
+		"system",
+	)
+
 	def __init__(
 		self,
 		id: int,
-		groupId: Optional[int] = None,
-		groupColor: Optional[str] = None,
-		name: Optional[str] = None,
-		shortName: Optional[str] = None,
-		nameOrig: Optional[str] = None,
-		fullname: Optional[str] = None,
-		myid: Optional[int] = None,
-		mapApp: Optional[bool] = None,
-		archive: Optional[bool] = None,
-		goPrefixRouteName: Optional[bool] = None,
-		goShowSchedule: Optional[bool] = None,
-		outdated: Optional[bool] = None,
-		distance: Optional[int] = None,
-		latitude: Optional[float] = None,
-		longitude: Optional[float] = None,
-		timezone: Optional[str] = None,
-		serviceTime: Optional[str] = None,
-		serviceTimeShort: Optional[str] = None,
-		systemId: Optional[int] = None,
-		system: Optional["TransportationSystem"] = None,
+		groupId: int | None = None,
+		groupColor: str | None = None,
+		name: str | None = None,
+		shortName: str | None = None,
+		nameOrig: str | None = None,
+		fullname: str | None = None,
+		myid: int | None = None,
+		mapApp: bool | None = None,
+		archive: bool | None = None,
+		goPrefixRouteName: bool | None = None,
+		goShowSchedule: bool | None = None,
+		outdated: bool | None = None,
+		distance: int | None = None,
+		latitude: float | None = None,
+		longitude: float | None = None,
+		timezone: str | None = None,
+		serviceTime: str | None = None,
+		serviceTimeShort: str | None = None,
+		systemId: int | None = None,
+		system: TransportationSystem | None = None,
 	):
 		"""
 		Initialize a Route instance.
@@ -213,7 +470,7 @@ class Route:
 		"""
 		self.id = id
 		self.groupId = groupId
-		self.groupColor = groupColor
+		self.groupColor = _intern(groupColor)
 		self.name = name
 		self.shortName = shortName
 		self.nameOrig = nameOrig
@@ -227,13 +484,14 @@ class Route:
 		self.distance = distance
 		self.latitude = latitude
 		self.longitude = longitude
+		self.timezone = _intern(timezone)
 		self.serviceTime = serviceTime
-		self.serviceTimeShort = serviceTimeShort
+		self.serviceTimeShort = _intern(serviceTimeShort)
 		self.systemId = systemId
 		self.system = system
 
 
-	def getStops(self) -> List["Stop"]:
+	def getStops(self) -> list[Stop]:
 		"""
 		Gets all stops served by this route.
 
@@ -245,20 +503,28 @@ class Route:
 			>>> stops = route.getStops()
 			>>> print(f"Route {route.name} has {len(stops)} stops")
 		"""
-		stopsForRoute = []
-		allStops = self.system.getStops()
+		allStops = self.system._getSharedStops()
+		index = self.system._getStopRouteIndex(allStops)
+
+		# Stops may list the route under any of its IDs
+		matches = []
+		for routeId in dict.fromkeys((self.myid, self.id, self.groupId)):
+			if routeId is not None and routeId in index:
+				matches.append(index[routeId])
 
-		for stop in allStops:
-			if \
-				self.myid in list(stop.routesAndPositions.keys()) or \
-				self.id in list(stop.routesAndPositions.keys()) or \
-				self.groupId in list(stop.routesAndPositions.keys()):
-				stopsForRoute.append(stop)
+		# A single match has no duplicates
+		if len(matches) == 1:
+			return(list(matches[0]))
 
-		return(stopsForRoute)
+		# Stops matched under several IDs are listed once, in the order of the system
+		matched = set()
+		for match in matches:
+			matched.update(map(id, match))
 
+		return([stop for stop in allStops if id(stop) in matched])
 
-class Stop:
+
+class Stop(_Model):
 	"""
 	Represents a transit stop/station within a transportation system.
 
@@ -283,16 +549,27 @@ class Stop:
 		...     print(f"Served by routes: {list(stop.routesAndPositions.keys())}")
 	"""
 
+	__slots__ = (
+		"id",
+		"routesAndPositions",
+		"systemId",
+		"name",
+		"latitude",
+		"longitude",
+		"radius",
+		"system",
+	)
+
 	def __init__(
 		self,
 		id: str,
-		routesAndPositions: Optional[Dict[str, List[int]]] = None,
-		systemId: Optional[int] = None,
-		name: Optional[str] = None,
-		latitude: Optional[float] = None,
-		longitude: Optional[float] = None,
-		radius: Optional[int] = None,
-		system: Optional[TransportationSystem] = None,
+		routesAndPositions: dict[str, list[int]] | None = None,
+		systemId: int | None = None,
+		name: str | None = None,
+		latitude: float | None = None,
+		longitude: float | None = None,
+		radius: int | None = None,
+		system: TransportationSystem | None = None,
 	):
 		"""
 		Initialize a Stop instance.
@@ -317,7 +594,7 @@ class Stop:
 		self.system = system
 
 
-class SystemAlert:
+class SystemAlert(_Model):
 	"""
 	Represents a service alert or notification for a transportation system.
 
@@ -362,37 +639,69 @@ class SystemAlert:
 		...     print(f"Active from {alert.dateTimeFrom} to {alert.dateTimeTo}")
 	"""
 
+	__slots__ = (
+		"id",
+		"systemId",
+		"system",
+		"routeId",
+		"name",
+		"html",
+		"archive",
+		"important",
+		"dateTimeCreated",
+		"dateTimeFrom",
+		"dateTimeTo",
+		"asPush",
+		"gtfs",
+		"gtfsAlertCauseId",
+		"gtfsAlertEffectId",
+		"gtfsAlertUrl",
+		"gtfsAlertHeaderText",
+		"gtfsAlertDescriptionText",
+		"routeGroupId",
+		"createdUtc",
+		"authorId",
+		"author",
+		"updated",
+		"updateAuthorId",
+		"updateAuthor",
+		"createdF",
+		"fromF",
+		"fromOk",
+		"toOk",
+	)
+
 	def __init__(
 		self,
 		id: int,
-		systemId: Optional[int] = None,
-		system: Optional[TransportationSystem] = None,
-		routeId: Optional[int] = None,
-		name: Optional[str] = None,
-		html: Optional[str] = None,
-		archive: Optional[bool] = None,
-		important: Optional[bool] = None,
-		dateTimeCreated: Optional[str] = None,
-		dateTimeFrom: Optional[str] = None,
-		dateTimeTo: Optional[str] = None,
-		asPush: Optional[bool] = None,
-		gtfs: Optional[bool] = None,
-		gtfsAlertCauseId: Optional[int] = None,
-		gtfsAlertEffectId: Optional[int] = None,
-		gtfsAlertUrl: Optional[str] = None,
-		gtfsAlertHeaderText: Optional[str] = None,
-		gtfsAlertDescriptionText: Optional[str] = None,
-		routeGroupId: Optional[int] = None,
-		createdUtc: Optional[str] = None,
-		authorId: Optional[int] = None,
-		author: Optional[str] = None,
-		updated: Optional[str] = None,
-		updateAuthorId: Optional[int] = None,
-		updateAuthor: Optional[str] = None,
-		createdF: Optional[str] = None,
-		fromF: Optional[str] = None,
-		fromOk: Optional[bool] = None,
-		toOk: Optional[bool] = None,
+		systemId: int | None = None,
+		system: TransportationSystem | None = None,
+		routeId: int | None = None,
+		name: str | None = None,
+		html: str | None = None,
+		archive: bool | None = None,
+		important: bool | None = None,
+		dateTimeCreated: str | None = None,
+		dateTimeFrom: str | None = None,
+		dateTimeTo: str | None = None,
+		asPush: bool | None = None,
+		gtfs: bool | None = None,
+		gtfsAlertCauseId: int | None = None,
+		gtfsAlertEffectId: int | None = None,
+		gtfsAlertUrl: str | None = None,
+		gtfsAlertHeaderText: str | None = None,
+		gtfsAlertDescriptionText: str | None = None,
+		routeGroupId: int | None = None,
+		createdUtc: str | None = None,
+		authorId: int | None = None,
+		author: str | None = None,
+		updated: str | None = None,
+		updateAuthorId: int | None = None,
+		updateAuthor: str | None = None,
+		createdF: str | None = None,
+		fromF: str | None = None,
+		fromOk: bool | None = None,
+		toOk: bool | None = None,
 	):
 		"""
 		Initialize a SystemAlert instance.
@@ -432,7 +741,7 @@ class SystemAlert:
 		self.toOk = toOk
 
 
-class Vehicle:
+class Vehicle(_Model):
 	"""
 	Represents a transit vehicle (bus, shuttle, etc.) in a transportation system.
 
@@ -471,24 +780,43 @@ class Vehicle:
 		...     print(f"Speed: {vehicle.speed}, Load: {vehicle.paxLoad}%")
 	"""
 
+	__slots__ = (
+		"id",
+		"name",
+		"type",
+		"system",
+		"calculatedCourse",
+		"routeId",
+		"routeName",
+		"color",
+		"created",
+		"latitude",
+		"longitude",
+		"speed",
+		"paxLoad",
+		"outOfService",
+		"more",
+		"tripId",
+	)
+
 	def __init__(
 		self,
-		id: Optional[str] = None,
-		name: Optional[str] = None,
-		type: Optional[str] = None,
-		system: Optional[TransportationSystem] = None,
-		calculatedCourse: Optional[int] = None,
-		routeId: Optional[str] = None,
-		routeName: Optional[str] = None,
-		color: Optional[str] = None,
-		created: Optional[str] = None,
-		latitude: Optional[float] = None,
-		longitude: Optional[float] = None,
-		speed: Optional[float] = None,
-		paxLoad: Optional[float] = None,
-		outOfService: Optional[bool] = None,
-		more: Optional[str] = None,
-		tripId: Optional[str] = None,
+		id: str | None = None,
+		name: str | None = None,
+		type: str | None = None,
+		system: TransportationSystem | None = None,
+		calculatedCourse: int | None = None,
+		routeId: str | None = None,
+		routeName: str | None = None,
+		color: str | None = None,
+		created: str | None = None,
+		latitude: float | None = None,
+		longitude: float | None = None,
+		speed: float | None = None,
+		paxLoad: float | None = None,
+		outOfService: bool | None = None,
+		more: str | None = None,
+		tripId: str | None = None,
 	):
 		"""
 		Initialize a Vehicle instance.
@@ -507,12 +835,12 @@ class Vehicle:
 		"""
 		self.id = id
 		self.name = name
-		self.type = type
+		self.type = _intern(type)
 		self.system = system
 		self.calculatedCourse = calculatedCourse
 		self.routeId = routeId
-		self.routeName = routeName
-		self.color = color
+		self.routeName = _intern(routeName)
+		self.color = _intern(color)
 		self.created = created
 		self.latitude = latitude
 		self.longitude = longitude
@@ -521,3 +849,25 @@ class Vehicle:
 		self.outOfService = outOfService
 		self.more = more
 		self.tripId = tripId
+
+
+class SystemSnapshot(NamedTuple):
+	"""
+	Routes, stops, alerts and vehicles of a transportation system fetched together.
+
+	Attributes:
+		system (TransportationSystem): System the data belongs to
+		routes (list): List of Route objects
+		stops (list): List of Stop objects
+		alerts (list): List of SystemAlert objects
+		vehicles (list): List of Vehicle objects
+
+	Example:
+		>>> snapshot = passiogo.getSystemSnapshot(system)
+		>>> print(f"{len(snapshot.vehicles)} vehicles on {len(snapshot.routes)} routes")
+	"""
+	system: TransportationSystem
+	routes: list[Route] | None
+	stops: list[Stop] | None
+	alerts: list[SystemAlert] | None
+	vehicles: list[Vehicle] | None
@@ -0,0 +1,335 @@
+"""
+PassioGo Spatial Data
+
+Coordinates of the stops and vehicles of a system as NumPy arrays, so that
+spatial queries (distances, bounding boxes, ...) run as vectorized array
+operations instead of Python loops over objects.
+
+Requires the optional `numpy` extra:
+
+    pip install passiogo[numpy]
+
+The Stop and Vehicle objects are left unchanged: the arrays are built from
+them once and cached on the system until its stops or vehicles are fetched
+again.
+
+Example:
+    >>> import passiogo
+    >>> from passiogo import spatial
+    >>>
+    >>> umich = passiogo.getSystemFromID(1270)
+    >>> coordinates = spatial.getVehicleCoordinates(umich)
+    >>> north = coordinates.latitude > 42.28
+    >>> [vehicle.name for vehicle, isNorth in zip(coordinates.items, north) if isNorth]
+    >>>
+    >>> # Vehicles within 500 meters of a point
+    >>> spatial.getVehiclesNear(umich, 42.2780, -83.7382, 500)
+
+Distance queries are compiled with Numba when it is installed:
+
+    pip install passiogo[numba]
+
+Author: PassioGo Contributors
+License: See LICENSE file
+"""
+
+import numpy as np
+from typing import List, NamedTuple, Union
+from .models import TransportationSystem, Stop, Vehicle
+from ._numba_kernels import haversineWithin
+
+
+class Coordinates(NamedTuple):
+	"""
+	Coordinates of a list of stops or vehicles.
+
+	Attributes:
+		items (list): The Stop or Vehicle objects, in the same order as the arrays
+		latitude (numpy.ndarray): Latitudes in degrees (NaN when unknown)
+		longitude (numpy.ndarray): Longitudes in degrees (NaN when unknown)
+	"""
+	items: list
+	latitude: np.ndarray
+	longitude: np.ndarray
+
+
+def _toFloat(value) -> float:
+	"""
+	Convert a coordinate to a float, reading missing values as NaN.
+
+	Args:
+		value: Coordinate to convert (can be float, str, or None)
+
+	Returns:
+		float: Value of the coordinate, or NaN
+	"""
+	try:
+		return(float(value))
+	except (TypeError, ValueError):
+		return(np.nan)
+
+
+def toCoordinates(
+	items: List[Union[Stop, Vehicle]]
+) -> Coordinates:
+	"""
+	Build the coordinate arrays of a list of stops or vehicles.
+
+	Args:
+		items: List of Stop or Vehicle objects
+
+	Returns:
+		Coordinates of the objects
+	"""
+	count = len(items)
+	return(Coordinates(
+		items = items,
+		latitude = np.fromiter(
+			(_toFloat(item.latitude) for item in items),
+			dtype = np.float64,
+			count = count
+		),
+		longitude = np.fromiter(
+			(_toFloat(item.longitude) for item in items),
+			dtype = np.float64,
+			count = count
+		),
+	))
+
+
+def _getCachedArrays(
+	system: TransportationSystem,
+	kind: str,
+	items: list,
+	build
+):
+	"""
+	Get arrays built from the stops or vehicles of a system.
+
+	The arrays are cached on the system and rebuilt when the cached list of
+	objects of the system changes.
+
+	Args:
+		system: The TransportationSystem the objects belong to
+		kind: Name of the arrays, e.g. "stops"
+		items: Cached list of objects of the system, see _getSharedStops()
+		build: Function building the arrays from `items`
+
+	Returns:
+		Value returned by `build`
+	"""
+	if items is None:
+		items = []
+
+	if system._coordinates is None:
+		system._coordinates = {}
+
+	# Return Cached Arrays
+	cached = system._coordinates.get(kind)
+	if cached is not None and cached[0] is items:
+		return(cached[1])
+
+	arrays = build(items)
+	system._coordinates[kind] = (items, arrays)
+	return(arrays)
+
+
+def getStopCoordinates(
+	system: TransportationSystem
+) -> Coordinates:
+	"""
+	Get the coordinates of all stops of a transportation system.
+
+	Args:
+		system: The TransportationSystem to query
+
+	Returns:
+		Coordinates of the stops returned by system.getStops()
+
+	Example:
+		>>> coordinates = spatial.getStopCoordinates(system)
+		>>> coordinates.latitude.min(), coordinates.latitude.max()
+	"""
+	return(_getCachedArrays(system, "stops", system._getSharedStops(), toCoordinates))
+
+
+def getVehicleCoordinates(
+	system: TransportationSystem
+) -> Coordinates:
+	"""
+	Get the coordinates of all active vehicles of a transportation system.
+
+	Args:
+		system: The TransportationSystem to query
+
+	Returns:
+		Coordinates of the vehicles returned by system.getVehicles()
+
+	Example:
+		>>> coordinates = spatial.getVehicleCoordinates(system)
+		>>> len(coordinates.items)
+	"""
+	return(_getCachedArrays(system, "vehicles", system._getSharedVehicles(), toCoordinates))
+
+
+# Vehicle Array Fields
+# (attribute, dtype, value for missing data)
+_VEHICLE_ARRAY_FIELDS = (
+	("latitude", np.float64, np.nan),
+	("longitude", np.float64, np.nan),
+	("speed", np.float32, np.nan),
+	("calculatedCourse", np.int16, -1),
+	("paxLoad", np.float32, np.nan),
+	("outOfService", np.bool_, False),
+)
+
+
+def toVehicleArray(
+	vehicles: List[Vehicle]
+) -> np.ndarray:
+	"""
+	Pack the numeric data of a list of vehicles into a structured array.
+
+	Each vehicle becomes one row of a few dozen bytes. The fields are
+	`id` plus the attributes listed below, each a column that can be
+	filtered in a single vectorized operation.
+
+	Args:
+		vehicles: List of Vehicle objects
+
+	Returns:
+		numpy.ndarray: One row per vehicle, in the same order, with the fields
+		               id (str), latitude, longitude (float64), speed,
+		               paxLoad (float32, NaN when unknown), calculatedCourse
+		               (int16, -1 when unknown or out of range) and outOfService (bool)
+
+	Example:
+		>>> array = spatial.toVehicleArray(system.getVehicles())
+		>>> array["id"][array["speed"] > 20]
+	"""
+	ids = [str(vehicle.id) for vehicle in vehicles]
+	idLength = max((len(vehicleId) for vehicleId in ids), default = 1)
+
+	array = np.empty(len(vehicles), dtype = [("id", f"U{idLength}")] + [
+		(attribute, dtype) for attribute, dtype, missing in _VEHICLE_ARRAY_FIELDS
+	])
+	array["id"] = ids
+
+	for attribute, dtype, missing in _VEHICLE_ARRAY_FIELDS:
+		column = array[attribute]
+
+		# Values out of the range of integer columns are missing
+		# (NumPy 1.x silently wraps them around when converting)
+		if np.issubdtype(dtype, np.integer):
+			low, high = np.iinfo(dtype).min, np.iinfo(dtype).max
+		else:
+			low, high = -np.inf, np.inf
+
+		for i, vehicle in enumerate(vehicles):
+			value = getattr(vehicle, attribute)
+			try:
+				number = float(value)
+			except (TypeError, ValueError, OverflowError):
+				column[i] = missing
+				continue
+			column[i] = dtype(number) if low <= number <= high else missing
+
+	return(array)
+
+
+def getVehicleArray(
+	system: TransportationSystem
+) -> np.ndarray:
+	"""
+	Get the numeric data of all active vehicles of a transportation system.
+
+	Args:
+		system: The TransportationSystem to query
+
+	Returns:
+		numpy.ndarray: Structured array of the vehicles returned by
+		               system.getVehicles(), see toVehicleArray()
+
+	Example:
+		>>> array = spatial.getVehicleArray(system)
+		>>> (~array["outOfService"]).sum()
+	"""
+	return(_getCachedArrays(system, "vehicleArray", system._getSharedVehicles(), toVehicleArray))
+
+
+def _itemsNear(
+	coordinates: Coordinates,
+	latitude: float,
+	longitude: float,
+	radius: float
+) -> list:
+	"""
+	Get the objects of a Coordinates tuple within a distance of a point.
+
+	Args:
+		coordinates: Coordinates of the objects
+		latitude: Latitude of the point, in degrees
+		longitude: Longitude of the point, in degrees
+		radius: Distance in meters
+
+	Returns:
+		List of the objects within `radius` meters of the point, in their original order
+	"""
+	within = haversineWithin(
+		coordinates.latitude,
+		coordinates.longitude,
+		latitude,
+		longitude,
+		radius
+	)
+	items = coordinates.items
+	return([items[i] for i in np.flatnonzero(within)])
+
+
+def getStopsNear(
+	system: TransportationSystem,
+	latitude: float,
+	longitude: float,
+	radius: float
+) -> List[Stop]:
+	"""
+	Get the stops of a transportation system within a distance of a point.
+
+	Args:
+		system: The TransportationSystem to query
+		latitude: Latitude of the point, in degrees
+		longitude: Longitude of the point, in degrees
+		radius: Great-circle distance in meters
+
+	Returns:
+		List of Stop objects within `radius` meters of the point
+
+	Example:
+		>>> stops = spatial.getStopsNear(system, 42.2780, -83.7382, 300)
+	"""
+	return(_itemsNear(getStopCoordinates(system), latitude, longitude, radius))
+
+
+def getVehiclesNear(
+	system: TransportationSystem,
+	latitude: float,
+	longitude: float,
+	radius: float
+) -> List[Vehicle]:
+	"""
+	Get the active vehicles of a transportation system within a distance of a point.
+
+	Args:
+		system: The TransportationSystem to query
+		latitude: Latitude of the point, in degrees
+		longitude: Longitude of the point, in degrees
+		radius: Great-circle distance in meters
+
+	Returns:
+		List of Vehicle objects within `radius` meters of the point
+
+	Example:
+		>>> stop = system.getStops()[0]
+		>>> vehicles = spatial.getVehiclesNear(system, stop.latitude, stop.longitude, 500)
+	"""
+	return(_itemsNear(getVehicleCoordinates(system), latitude, longitude, radius))
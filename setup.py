@@ -1,3 +1,4 @@
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", 'r') as f:
@@ -6,6 +7,18 @@ with open("README.md", 'r') as f:
 with open("requirements.txt", "r") as fh:
     requires = [line for line in fh.read().splitlines() if line != ""]
 
+# Optional Compiled Models
+# Set PASSIOGO_COMPILE=1 to compile passiogo/models.py with Cython. The .py
+# source is always shipped, so imports fall back to it without the extension.
+extModules = []
+if os.environ.get("PASSIOGO_COMPILE") == "1":
+	from Cython.Build import cythonize
+	extModules = cythonize(
+		["passiogo/models.py"],
+		# Type hints are documentation only, the API does not always match them
+		compiler_directives = {"language_level": 3, "annotation_typing": False},
+	)
+
 setup(
 	name='PassioGo',
 	version="0.2.2",
@@ -18,6 +31,14 @@ setup(
 	packages=find_packages(),
 	py_modules=find_packages(),
 	install_requires=requires,
+	ext_modules=extModules,
+	extras_require={
+		"async": ["aiohttp>=3.8"],
+		"fast": ["orjson>=3.0"],
+		"stream": ["ijson>=3.1"],
+		"numpy": ["numpy>=1.20"],
+		"numba": ["numpy>=1.20", "numba>=0.53"],
+	},
 	project_urls = {
 		'Documentation': 'https://passiogo.readthedocs.io/',
 		'GitHub': 'https://github.com/athuler/PassioGo',
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+import passiogo
+
+aiohttp = pytest.importorskip("aiohttp")
+from passiogo import aclient
+
+
+STOPS = {
+	"routes" : {"11" : ["Route 1", "#ff0000", [0, "s1"], [0, "s2"]]},
+	"stops" : {
+		"s1" : {"id" : "s1", "userId" : "1068", "name" : "Stop 1", "latitude" : 1.0, "longitude" : 2.0},
+		"s2" : {"id" : "s2", "userId" : "1068", "name" : "Stop 2", "latitude" : 1.5, "longitude" : 2.5},
+	},
+}
+
+
+@pytest.fixture
+def response(monkeypatch):
+	async def sendApiRequest(url, body):
+		return(STOPS)
+	monkeypatch.setattr(aclient, "sendApiRequest", sendApiRequest)
+	return(STOPS)
+
+
+def test_getStops(response):
+	system = passiogo.TransportationSystem(id = 1068)
+	stops = asyncio.run(aclient.getStops(system))
+	assert [stop.id for stop in stops] == ["s1", "s2"]
+	assert stops[1].routesAndPositions == {"11" : [1]}
+
+
+def test_getStopsRaw(response):
+	system = passiogo.TransportationSystem(id = 1068)
+	stops = asyncio.run(aclient.getStops(system, raw = True))
+	assert stops == response and stops is not response
+
+	# The cached response is not changed through the returned copy
+	stops["stops"]["s1"]["name"] = "Changed"
+	assert response["stops"]["s1"]["name"] == "Stop 1"
+
+
+class Response:
+	def __init__(self, status, content = b"", headers = None):
+		self.status = status
+		self.content = content
+		self.headers = headers or {}
+
+	async def __aenter__(self):
+		return(self)
+
+	async def __aexit__(self, *args):
+		return(False)
+
+	async def read(self):
+		return(self.content)
+
+
+class Session:
+	"""Replays the given responses, recording the headers of each request."""
+	closed = False
+
+	def __init__(self, *responses):
+		self.responses = list(responses)
+		self.sentHeaders = []
+
+	def post(self, url, json = None, headers = None):
+		self.sentHeaders.append(headers or {})
+		# The cached response is evicted while the request is in flight
+		passiogo.client._etagCache.clear()
+		return(self.responses.pop(0))
+
+	async def close(self):
+		self.closed = True
+
+
+def test_notModifiedAfterEviction():
+	url = "https://passiogo.com/mapGetData.php?getStops=2"
+	body = {"s0" : "1068", "sA" : 1}
+	cacheKey = passiogo.client._responseCacheKey(url, body)
+	passiogo.client._etagCache[cacheKey] = {
+		"etag" : '"v1"', "lastModified" : None, "hash" : b"", "response" : STOPS,
+	}
+	session = Session(Response(304), Response(200, b'{"stops" : {}, "error" : ""}'))
+
+	async def main():
+		aclient.setSession(session)
+		try:
+			return(await aclient.sendApiRequest(url, body))
+		finally:
+			await aclient.closeSession()
+
+	try:
+		assert asyncio.run(main()) == {"stops" : {}, "error" : ""}
+		assert session.sentHeaders == [{"If-None-Match" : '"v1"'}, {}]
+	finally:
+		passiogo.client._etagCache.clear()
@@ -0,0 +1,171 @@
+import json
+import pytest
+from passiogo import client
+
+
+URL = "https://passiogo.com/mapGetData.php?getStops=2"
+BODY = {"s0" : "1068", "sA" : 1}
+
+
+class Response:
+	def __init__(self, statusCode, content = b"", headers = None):
+		self.status_code = statusCode
+		self.content = content
+		self.headers = headers or {}
+
+
+class Session:
+	"""Replays the given responses, recording the headers of each request."""
+	def __init__(self, *responses, onPost = None):
+		self.responses = list(responses)
+		self.sentHeaders = []
+		self.onPost = onPost
+
+	def post(self, url, json = None, headers = None, timeout = None):
+		self.sentHeaders.append(headers or {})
+		if self.onPost is not None:
+			self.onPost()
+		return(self.responses.pop(0))
+
+
+@pytest.fixture(autouse = True)
+def emptyCache():
+	client._etagCache.clear()
+	yield
+	client._etagCache.clear()
+
+
+def test_notModified(monkeypatch):
+	content = json.dumps({"stops" : {}, "error" : ""}).encode()
+	session = Session(
+		Response(200, content, {"ETag" : '"v1"'}),
+		Response(304),
+	)
+	monkeypatch.setattr(client, "_SESSION", session)
+
+	first = client.sendApiRequest(URL, BODY)
+	assert client.sendApiRequest(URL, BODY) is first
+	assert session.sentHeaders == [{}, {"If-None-Match" : '"v1"'}]
+
+
+def test_notModifiedAfterEviction(monkeypatch):
+	content = json.dumps({"stops" : {}, "error" : ""}).encode()
+	monkeypatch.setattr(client, "_SESSION", Session(Response(200, content, {"ETag" : '"v1"'})))
+	client.sendApiRequest(URL, BODY)
+
+	# The cached response is evicted while the conditional request is in flight
+	session = Session(
+		Response(304),
+		Response(200, content, {"ETag" : '"v1"'}),
+		onPost = client._etagCache.clear,
+	)
+	monkeypatch.setattr(client, "_SESSION", session)
+
+	assert client.sendApiRequest(URL, BODY) == {"stops" : {}, "error" : ""}
+	assert session.sentHeaders == [{"If-None-Match" : '"v1"'}, {}]
+
+
+STOPS = {
+	"routes" : {"11" : ["Route 1", "#ff0000", [0, "s1"], [0, "s2"]]},
+	"stops" : {
+		"s1" : {"id" : "s1", "userId" : "1068", "name" : "Stop 1", "latitude" : 1.0, "longitude" : 2.0},
+		"s2" : {"id" : "s2", "userId" : "1068", "name" : "Stop 2", "latitude" : 1.5, "longitude" : 2.5},
+	},
+}
+
+
+@pytest.fixture
+def apiRequests(monkeypatch):
+	"""Answers getStops requests with STOPS, recording each request."""
+	apiRequests = []
+	def sendApiRequest(url, body):
+		apiRequests.append(url)
+		return(json.loads(json.dumps(STOPS)))
+	monkeypatch.setattr(client, "sendApiRequest", sendApiRequest)
+	return(apiRequests)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	clock = [1000.0]
+	monkeypatch.setattr(client.time, "monotonic", lambda: clock[0])
+	return(clock)
+
+
+def test_instanceCacheExpiry(apiRequests, clock):
+	system = client.TransportationSystem(id = 1068)
+	stops = system.getStops()
+	clock[0] += client._STOPS_TTL - 1
+	assert [stop.id for stop in system.getStops()] == ["s1", "s2"]
+	assert len(apiRequests) == 1
+
+	clock[0] += 1
+	assert system.getStops()[0] is not stops[0]
+	assert len(apiRequests) == 2
+
+
+def test_instanceCacheRefresh(apiRequests, clock):
+	system = client.TransportationSystem(id = 1068)
+	stops = system.getStops()
+	assert system.getStops(refresh = True)[0] is not stops[0]
+	assert len(apiRequests) == 2
+
+	# The refreshed result replaces the cached one
+	system.getStops()
+	assert len(apiRequests) == 2
+
+
+def test_instanceCacheCopies(apiRequests, clock):
+	system = client.TransportationSystem(id = 1068)
+	stops = system.getStops()
+	stops.pop()
+	stops.reverse()
+	assert [stop.id for stop in system.getStops()] == ["s1", "s2"]
+
+	route = client.Route(id = "11", system = system)
+	assert [stop.id for stop in route.getStops()] == ["s1", "s2"]
+	assert len(apiRequests) == 1
+
+	# The stops of each route are indexed once per cached list of stops
+	index = system._stopRouteIndex[1]
+	route.getStops()
+	assert system._stopRouteIndex[1] is index
+
+
+def test_instanceCacheRaw(apiRequests, clock):
+	system = client.TransportationSystem(id = 1068)
+	system.getStops(raw = True)["stops"].clear()
+	assert len(system.getStops(raw = True)["stops"]) == 2
+
+
+class Index:
+	"""Integer type which is not an int subclass, like NumPy integers."""
+	def __init__(self, value):
+		self.value = value
+
+	def __index__(self):
+		return(self.value)
+
+
+@pytest.fixture
+def systems(monkeypatch):
+	system = client.TransportationSystem(id = 1068)
+	monkeypatch.setattr(client, "getSystems", lambda appVersion, sortMode: [system])
+	monkeypatch.setitem(client._systemsCache, "byId", {1068: system})
+	return(system)
+
+
+def test_getSystemFromID(systems):
+	assert client.getSystemFromID(1068) is systems
+	assert client.getSystemFromID(Index(1068), appVersion = Index(2)) is systems
+	assert client.getSystemsFromIDs([Index(1068), 1270]) == {1068: systems, 1270: None}
+
+
+@pytest.mark.parametrize("id", [True, 1068.0, "1068", None])
+def test_getSystemFromIDInvalid(systems, id):
+	with pytest.raises(TypeError):
+		client.getSystemFromID(id)
+	with pytest.raises(TypeError):
+		client.getSystemsFromIDs([1068, id])
+	with pytest.raises(TypeError):
+		client.getSystemFromID(1068, sortMode = id)
@@ -0,0 +1,54 @@
+import io
+import json
+import pytest
+import passiogo
+from passiogo import client
+
+ijson = pytest.importorskip("ijson")
+
+
+ROUTES = {
+	"11" : ["Route 1", "#ff0000", [0, "s1"], 0, [0, "s2"], [0, "s1"]],
+	"12" : ["Route 2", "#00ff00", [0, "s2"]],
+}
+STOPS = {
+	"s1" : {"id" : "s1", "userId" : "1068", "name" : "Stop 1", "latitude" : 1.0, "longitude" : 2.0, "radius" : 50},
+	"s2" : {"id" : "s2", "userId" : "1068", "name" : "Stop 2", "latitude" : 1.5, "longitude" : 2.5, "radius" : 50},
+}
+
+
+def streamStops(response):
+	system = passiogo.TransportationSystem(id = 1068)
+	stream = io.BytesIO(json.dumps(response).encode())
+	return(client._parseStopsStream(stream, system))
+
+
+@pytest.mark.parametrize("response", [
+	{"routes" : ROUTES, "stops" : STOPS, "error" : ""},
+	{"error" : "", "stops" : STOPS, "routes" : ROUTES},
+], ids = ["routesBeforeStops", "routesAfterStops"])
+def test_streamStops(response):
+	stops = streamStops(response)
+	assert [stop.id for stop in stops] == ["s1", "s2"]
+	assert stops[0].routesAndPositions == {"11" : [0, 2]}
+	assert stops[1].routesAndPositions == {"11" : [1], "12" : [0]}
+	assert [vars(stop) for stop in stops] == [
+		vars(stop) for stop in client._parseStops(response, stops[0].system)
+	]
+
+
+@pytest.mark.parametrize("routes", [[], None, {}], ids = ["list", "null", "dict"])
+def test_streamStopsWithoutRoutes(routes):
+	stops = streamStops({"stops" : STOPS, "routes" : routes})
+	assert [stop.id for stop in stops] == ["s1", "s2"]
+	assert [stop.routesAndPositions for stop in stops] == [{}, {}]
+
+
+@pytest.mark.parametrize("stops", [[], None, {}], ids = ["list", "null", "dict"])
+def test_streamStopsWithoutStops(stops):
+	assert streamStops({"routes" : ROUTES, "stops" : stops}) == []
+
+
+def test_streamStopsError():
+	with pytest.raises(Exception, match = "Error in Response"):
+		streamStops({"error" : "Invalid system", "stops" : STOPS})
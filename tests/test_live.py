@@ -0,0 +1,67 @@
+import json
+import pytest
+import passiogo
+
+live = pytest.importorskip("passiogo.live")
+
+
+@pytest.fixture
+def system():
+	return(passiogo.TransportationSystem(id = 1068))
+
+
+@pytest.fixture
+def vehicles(system):
+	return({"v1" : passiogo.Vehicle(id = "v1", name = "Bus 1", latitude = 1.0, longitude = 2.0, system = system)})
+
+
+def test_applyDictFrame(system, vehicles):
+	updatedAt = {}
+	frame = json.dumps({"busId" : "v1", "latitude" : 1.5, "longitude" : 2.5, "course" : 90})
+	updated = live._applyFrame(frame, vehicles, updatedAt, system)
+	assert updated == [vehicles["v1"]]
+	assert (vehicles["v1"].latitude, vehicles["v1"].longitude) == (1.5, 2.5)
+	assert vehicles["v1"].calculatedCourse == 90
+	assert vehicles["v1"].name == "Bus 1"
+	assert list(updatedAt) == ["v1"]
+
+
+def test_applyListFrame(system, vehicles):
+	updatedAt = {}
+	frame = json.dumps([
+		{"busId" : "v1", "latitude" : 1.5},
+		{"busId" : 2, "latitude" : 3.0, "longitude" : 4.0, "paxLoad" : 20},
+		{"latitude" : 5.0},
+		"v1",
+	])
+	updated = live._applyFrame(frame, vehicles, updatedAt, system)
+	assert [vehicle.id for vehicle in updated] == ["v1", "2"]
+	assert vehicles["v1"].latitude == 1.5
+	assert vehicles["v1"].longitude == 2.0
+	assert sorted(updatedAt) == ["2", "v1"]
+
+
+def test_applyUnknownVehicle(system, vehicles):
+	updatedAt = {}
+	updated = live._applyFrame(json.dumps({"busId" : "v9", "latitude" : 3.0}), vehicles, updatedAt, system)
+	assert [vehicle.id for vehicle in updated] == ["v9"]
+	assert vehicles["v9"].latitude == 3.0
+	assert vehicles["v9"].longitude is None
+	assert vehicles["v9"].system is system
+
+
+@pytest.mark.parametrize("message", ["{", "", "null", "42", '"v1"'])
+def test_applyMalformedFrame(system, vehicles, message):
+	updatedAt = {}
+	assert live._applyFrame(message, vehicles, updatedAt, system) == []
+	assert list(vehicles) == ["v1"]
+	assert updatedAt == {}
+
+
+def test_expireVehicles(system, vehicles):
+	vehicles["v2"] = passiogo.Vehicle(id = "v2", system = system)
+	updatedAt = {"v1" : 100.0, "v2" : 100.0 + live.VEHICLE_EXPIRY}
+	expired = live._expireVehicles(vehicles, updatedAt, 100.0 + live.VEHICLE_EXPIRY + 1)
+	assert [vehicle.id for vehicle in expired] == ["v1"]
+	assert list(vehicles) == ["v2"]
+	assert list(updatedAt) == ["v2"]
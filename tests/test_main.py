@@ -24,6 +24,16 @@ def test_getSystemFromId():
 	assert True
 
 
+def test_getSystemsFromIDs():
+	systems = passiogo.getSystemsFromIDs([1068])
+	assert systems[1068].id == 1068
+
+
+def test_getSystemSnapshot():
+	snapshot = passiogo.getSystemSnapshot(passiogo.getSystemFromID(1068))
+	assert snapshot.system.id == 1068
+
+
 @pytest.mark.parametrize("system", pytest.allSystems, ids=ids)
 def test_getAllRoutes(system):
 	system.getRoutes()
@@ -0,0 +1,50 @@
+import pytest
+import passiogo
+
+
+@pytest.fixture
+def system(monkeypatch):
+	system = passiogo.TransportationSystem(id = 1068)
+	stops = [
+		passiogo.Stop(id = "a", routesAndPositions = {"g" : [0]}, system = system),
+		passiogo.Stop(id = "b", routesAndPositions = {"11" : [1]}, system = system),
+		passiogo.Stop(id = "c", routesAndPositions = {"11" : [2], "g" : [3]}, system = system),
+		passiogo.Stop(id = "d", routesAndPositions = {"12" : [0]}, system = system),
+	]
+	monkeypatch.setattr(passiogo.TransportationSystem, "_getSharedStops", lambda self, **kwargs: stops)
+	return(system)
+
+
+def test_routeGetStops(system):
+	route = passiogo.Route(id = "11", system = system)
+	assert [stop.id for stop in route.getStops()] == ["b", "c"]
+
+
+def test_routeGetStopsMultipleIds(system):
+	route = passiogo.Route(id = "11", groupId = "g", system = system)
+	assert [stop.id for stop in route.getStops()] == ["a", "b", "c"]
+
+
+def test_routeGetStopsNoMatch(system):
+	route = passiogo.Route(id = "13", myid = None, system = system)
+	assert route.getStops() == []
+
+
+def test_equality():
+	system = passiogo.TransportationSystem(id = 1068)
+	first = passiogo.Stop(id = "s1", name = "Stop 1", system = system)
+	second = passiogo.Stop(id = "s1", name = "Renamed", system = passiogo.TransportationSystem(id = 1068))
+	assert first == second and hash(first) == hash(second)
+	assert len({first, second}) == 1
+
+	assert first != passiogo.Stop(id = "s2", system = system)
+	assert first != passiogo.Route(id = "s1", system = system)
+	assert passiogo.Stop(id = None, system = system) != passiogo.Stop(id = None, system = system)
+
+
+@pytest.mark.parametrize("model", [passiogo.Route, passiogo.Stop, passiogo.Vehicle])
+def test_equalityAcrossSystems(model):
+	first = model(id = "1", system = passiogo.TransportationSystem(id = 1068))
+	second = model(id = "1", system = passiogo.TransportationSystem(id = 1270))
+	assert first != second
+	assert len({first, second}) == 2
@@ -0,0 +1,136 @@
+import math
+import pytest
+import passiogo
+
+np = pytest.importorskip("numpy")
+spatial = pytest.importorskip("passiogo.spatial")
+kernels = pytest.importorskip("passiogo._numba_kernels")
+
+HALF_CIRCUMFERENCE = math.pi * kernels.EARTH_RADIUS_M
+
+
+@pytest.mark.parametrize("course", ["400000", "32768", "-32769", "-1e40", "inf", "nan", "north", None, 10 ** 400])
+def test_toVehicleArrayInvalidCourse(course):
+	array = spatial.toVehicleArray([passiogo.Vehicle(id = "v1", calculatedCourse = course, speed = "12.5")])
+	assert array["calculatedCourse"][0] == -1
+	assert array["speed"][0] == 12.5
+
+
+@pytest.mark.parametrize("course", [32767, -32768])
+def test_toVehicleArrayCourseLimits(course):
+	array = spatial.toVehicleArray([passiogo.Vehicle(id = "v1", calculatedCourse = str(course))])
+	assert array["calculatedCourse"][0] == course
+
+
+def test_toVehicleArray():
+	array = spatial.toVehicleArray([
+		passiogo.Vehicle(id = "v1", latitude = 1.0, longitude = "2.0", calculatedCourse = "90", paxLoad = 10, outOfService = 0),
+		passiogo.Vehicle(id = "vehicle2", outOfService = 1),
+	])
+	assert list(array["id"]) == ["v1", "vehicle2"]
+	assert list(array["calculatedCourse"]) == [90, -1]
+	assert array["longitude"][0] == 2.0
+	assert math.isnan(array["latitude"][1])
+	assert list(array["outOfService"]) == [False, True]
+
+
+def haversineDistance(latitude1, longitude1, latitude2, longitude2):
+	latitude1, longitude1, latitude2, longitude2 = map(math.radians, (latitude1, longitude1, latitude2, longitude2))
+	haversine = (
+		math.sin((latitude2 - latitude1) / 2) ** 2 +
+		math.cos(latitude1) * math.cos(latitude2) * math.sin((longitude2 - longitude1) / 2) ** 2
+	)
+	return(2 * kernels.EARTH_RADIUS_M * math.asin(math.sqrt(min(haversine, 1.0))))
+
+
+@pytest.fixture(params = ["numba", "numpy"])
+def kernel(request, monkeypatch):
+	if request.param == "numba" and kernels._haversineWithinNumba is None:
+		pytest.skip("numba is not installed")
+	if request.param == "numpy":
+		monkeypatch.setattr(kernels, "_haversineWithinNumba", None)
+	return(request.param)
+
+
+@pytest.fixture
+def points():
+	random = np.random.default_rng(1270)
+	latitudes = np.concatenate([random.uniform(-90, 90, 2000), 42.278 + random.normal(0, 0.01, 2000)])
+	longitudes = np.concatenate([random.uniform(-180, 180, 2000), -83.738 + random.normal(0, 0.01, 2000)])
+	return(latitudes, longitudes)
+
+
+@pytest.mark.parametrize("center", [(42.278, -83.738), (-89.9, 170.0), (0.0, 179.99)])
+@pytest.mark.parametrize("radius", [0, 500, 5000, 1e6, 1e7, HALF_CIRCUMFERENCE * 0.999])
+def test_haversineWithin(kernel, points, center, radius):
+	latitudes, longitudes = points
+	within = kernels.haversineWithin(latitudes, longitudes, center[0], center[1], radius)
+	assert within.dtype == np.bool_ and within.shape == latitudes.shape
+
+	for i, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+		distance = haversineDistance(center[0], center[1], latitude, longitude)
+		# Skip points on the boundary, where rounding decides
+		if abs(distance - radius) > 1e-6 * max(radius, 1.0):
+			assert within[i] == (distance <= radius), (latitude, longitude, distance)
+
+
+@pytest.mark.parametrize("radius", [HALF_CIRCUMFERENCE, HALF_CIRCUMFERENCE * 2, math.inf])
+def test_haversineWithinWholeEarth(kernel, points, radius):
+	latitudes, longitudes = points
+	assert kernels.haversineWithin(latitudes, longitudes, 42.278, -83.738, radius).all()
+	assert kernels.haversineWithin(latitudes, longitudes, -42.278, 96.262, radius).all()
+
+
+def test_haversineWithinNaN(kernel):
+	latitudes = np.array([42.278, np.nan, 42.278, np.nan, 42.279])
+	longitudes = np.array([-83.738, -83.738, np.nan, np.nan, -83.738])
+	within = kernels.haversineWithin(latitudes, longitudes, 42.278, -83.738, HALF_CIRCUMFERENCE)
+	assert list(within) == [True, False, False, False, True]
+
+	assert not kernels.haversineWithin(latitudes, longitudes, np.nan, -83.738, HALF_CIRCUMFERENCE).any()
+	assert not kernels.haversineWithin(latitudes, longitudes, 42.278, -83.738, np.nan).any()
+
+
+def test_haversineWithinEmpty(kernel):
+	assert kernels.haversineWithin(np.empty(0), np.empty(0), 42.278, -83.738, 500).shape == (0,)
+
+
+@pytest.fixture
+def system(monkeypatch):
+	system = passiogo.TransportationSystem(id = 1270)
+	stops = [
+		passiogo.Stop(id = "s1", latitude = 42.2780, longitude = -83.7382, system = system),
+		passiogo.Stop(id = "s2", latitude = "42.2790", longitude = "-83.7382", system = system),
+		passiogo.Stop(id = "s3", latitude = 42.3000, longitude = -83.7382, system = system),
+		passiogo.Stop(id = "s4", system = system),
+	]
+	vehicles = [
+		passiogo.Vehicle(id = "v1", latitude = 42.2781, longitude = -83.7383, system = system),
+		passiogo.Vehicle(id = "v2", latitude = None, longitude = -83.7382, system = system),
+		passiogo.Vehicle(id = "v3", latitude = 42.2700, longitude = -83.7382, system = system),
+	]
+	for name in ("getStops", "_getSharedStops"):
+		monkeypatch.setattr(passiogo.TransportationSystem, name, lambda self, **kwargs: stops)
+	for name in ("getVehicles", "_getSharedVehicles"):
+		monkeypatch.setattr(passiogo.TransportationSystem, name, lambda self, **kwargs: vehicles)
+	return(system)
+
+
+@pytest.mark.parametrize("radius", [0, 50, 200, 3000, HALF_CIRCUMFERENCE])
+def test_getStopsNear(kernel, system, radius):
+	expected = [
+		stop for stop in system.getStops()
+		if stop.latitude is not None and
+		haversineDistance(42.2780, -83.7382, float(stop.latitude), float(stop.longitude)) <= radius
+	]
+	assert spatial.getStopsNear(system, 42.2780, -83.7382, radius) == expected
+
+
+@pytest.mark.parametrize("radius", [0, 50, 1000, HALF_CIRCUMFERENCE])
+def test_getVehiclesNear(kernel, system, radius):
+	expected = [
+		vehicle for vehicle in system.getVehicles()
+		if vehicle.latitude is not None and
+		haversineDistance(42.2780, -83.7382, vehicle.latitude, vehicle.longitude) <= radius
+	]
+	assert spatial.getVehiclesNear(system, 42.2780, -83.7382, radius) == expected